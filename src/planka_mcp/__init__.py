@@ -2,47 +2,71 @@
 Planka MCP Server - Modular Package
 
 This package provides tools to interact with Planka kanban boards.
+
+Public names are resolved lazily (PEP 562) so that importing a single
+submodule, e.g. ``planka_mcp.cache``, does not pull in the FastAPI server
+and every handler.
+
+The live API client and cache are ``planka_mcp.instances.api_client`` and
+``planka_mcp.instances.cache``; they are not re-exported here, since a copy
+taken at import time would stay ``None`` after startup.
 """
 
-from .server import mcp
-from .instances import api_client, cache
-from .handlers import (
-    planka_get_workspace,
-    planka_list_cards,
-    planka_find_and_get_card,
-    planka_get_card,
-    planka_create_card,
-    planka_update_card,
-    planka_add_task,
-    planka_update_task,
-    planka_add_card_label,
-    planka_remove_card_label,
-    fetch_workspace_data,
-    planka_get_workspace
-)
-from .models import (
-    ResponseFormat,
-    DetailLevel,
-    ResponseContext,
-    GetWorkspaceInput,
-    ListCardsInput,
-    GetCardInput,
-    CreateCardInput,
-    UpdateCardInput,
-    FindAndGetCardInput,
-    AddTaskInput,
-    UpdateTaskInput,
-    AddCardLabelInput,
-    RemoveCardLabelInput,
-    DeleteCardInput,
-    DeleteTaskInput
-)
-from .cache import CacheEntry, PlankaCache
-from .utils import handle_api_error, ResponseFormatter, PaginationHelper
-from .api_client import PlankaAPIClient
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_EXPORTS = {
+    'mcp': '.server',
+    'planka_get_workspace': '.handlers',
+    'planka_list_cards': '.handlers',
+    'planka_find_and_get_card': '.handlers',
+    'planka_get_card': '.handlers',
+    'planka_create_card': '.handlers',
+    'planka_update_card': '.handlers',
+    'planka_add_task': '.handlers',
+    'planka_update_task': '.handlers',
+    'planka_add_card_label': '.handlers',
+    'planka_add_card_labels_bulk': '.handlers',
+    'planka_remove_card_label': '.handlers',
+    'fetch_workspace_data': '.handlers',
+    'ResponseFormat': '.models',
+    'DetailLevel': '.models',
+    'ResponseContext': '.models',
+    'GetWorkspaceInput': '.models',
+    'ListCardsInput': '.models',
+    'GetCardInput': '.models',
+    'CreateCardInput': '.models',
+    'UpdateCardInput': '.models',
+    'FindAndGetCardInput': '.models',
+    'AddTaskInput': '.models',
+    'UpdateTaskInput': '.models',
+    'AddCardLabelInput': '.models',
+    'AddCardLabelsBulkInput': '.models',
+    'RemoveCardLabelInput': '.models',
+    'DeleteCardInput': '.models',
+    'DeleteTaskInput': '.models',
+    'CacheEntry': '.cache',
+    'PlankaCache': '.cache',
+    'handle_api_error': '.utils',
+    'ResponseFormatter': '.utils',
+    'PaginationHelper': '.utils',
+    'PlankaAPIClient': '.api_client',
+}
+
+def __getattr__(name):
+    """Import public names on first access and cache them on the package."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 __all__ = [
-    'mcp', 'api_client', 'cache',
+    'mcp',
     'planka_get_workspace',
     'planka_list_cards',
     'planka_find_and_get_card',
@@ -52,6 +76,7 @@ __all__ = [
     'planka_add_task',
     'planka_update_task',
     'planka_add_card_label',
+    'planka_add_card_labels_bulk',
     'planka_remove_card_label',
     'fetch_workspace_data',
     'ResponseFormat',
@@ -66,6 +91,7 @@ __all__ = [
     'AddTaskInput',
     'UpdateTaskInput',
     'AddCardLabelInput',
+    'AddCardLabelsBulkInput',
     'RemoveCardLabelInput',
     'DeleteCardInput',
     'DeleteTaskInput',
@@ -75,4 +101,4 @@ __all__ = [
     'ResponseFormatter',
     'PaginationHelper',
     'PlankaAPIClient'
-]
\ No newline at end of file
+]
@@ -1,31 +1,129 @@
+import asyncio
 import os
 import sys
+import time
 import httpx
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 from dotenv import load_dotenv
 
+from .utils import json_loads
+
 # ==================== API CLIENT ====================
 
+# Fail fast when Planka is unreachable or the pool is exhausted, but give
+# large board payloads time to arrive
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=5.0, pool=5.0)
+
+# Retries of failed connection attempts (never of sent requests)
+CONNECT_RETRIES = 2
+
+# All requests go to a single Planka origin: keep a warm pool of connections
+# and multiplex concurrent requests over HTTP/2 instead of queueing on the
+# default 10-connection keep-alive pool.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0
+)
+
+# Requests in flight at once, across all tools; overridable with
+# PLANKA_MAX_CONCURRENCY. Keeps workspace-wide fan-out from flooding Planka.
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Requests started per second, with bursts of the same size; overridable
+# with PLANKA_RATE_LIMIT (0 disables). Fan-out self-throttles instead of
+# running into HTTP 429.
+DEFAULT_RATE_LIMIT = 50.0
+
+# Retries of requests answered with HTTP 429, with exponential backoff
+# (or the server's Retry-After) between attempts
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 0.5
+MAX_RETRY_DELAY = 10.0
+
+# GET responses remembered with their ETag, most recently used last. Repeat
+# GETs send If-None-Match and reuse the stored body on 304 Not Modified, so
+# unchanged boards are not downloaded again.
+ETAG_CACHE_SIZE = 256
+
+class RateLimiter:
+    """Token bucket: `rate` requests per second, bursts of up to `rate` requests."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request may be started."""
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1
+                self._updated = time.monotonic()
+            self._tokens -= 1
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a rate limited request."""
+    retry_after = response.headers.get("Retry-After", "")
+    try:
+        delay = float(retry_after)
+    except ValueError:
+        delay = RATE_LIMIT_BACKOFF * 2 ** attempt
+    return min(max(delay, 0.0), MAX_RETRY_DELAY)
+
 class PlankaAPIClient:
     """Centralized API client for all Planka requests."""
 
-    def __init__(self, base_url: str, auth_token: str):
+    def __init__(
+        self,
+        base_url: str,
+        auth_token: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        rate_limit: float = DEFAULT_RATE_LIMIT
+    ):
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
         self.base_url = base_url.rstrip('/')
+        # Parsed once; endpoints are resolved against it per request
+        self._api_base = httpx.URL(f"{self.base_url}/api/")
         self.auth_token = auth_token
         self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate_limiter = RateLimiter(rate_limit) if rate_limit > 0 else None
+        # URL -> (ETag, raw body) of recent GET responses
+        self._etags: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
 
     async def get_client(self) -> httpx.AsyncClient:
         """Get or create async HTTP client."""
         if self._client is None:
+            headers = {"Content-Type": "application/json"}
+            if self.auth_token:
+                headers["Authorization"] = f"Bearer {self.auth_token}"
             self._client = httpx.AsyncClient(
-                timeout=30.0,  # DEFAULT_TIMEOUT
-                headers={
-                    "Authorization": f"Bearer {self.auth_token}",
-                    "Content-Type": "application/json"
-                }
+                timeout=DEFAULT_TIMEOUT,
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True,
+                    limits=DEFAULT_LIMITS,
+                    retries=CONNECT_RETRIES
+                ),
+                headers=headers
             )
         return self._client
 
+    def set_auth_token(self, auth_token: str):
+        """Use a new access token, including on an already open HTTP client."""
+        self.auth_token = auth_token
+        if self._client is not None:
+            self._client.headers["Authorization"] = f"Bearer {auth_token}"
+
     async def request(
         self,
         method: str,
@@ -34,32 +132,73 @@ class PlankaAPIClient:
         json_data: Optional[Dict] = None,
         files: Optional[Dict] = None
     ) -> Dict[str, Any]:
-        """Make authenticated API request with error handling."""
+        """Make authenticated API request with error handling.
+
+        GET responses carrying an ETag are revalidated on the next GET of the
+        same URL; the stored body is parsed again and returned when Planka
+        answers 304 Not Modified. Callers get a fresh object every time, so
+        caches that patch a response in place never leak into later reads.
+        """
         client = await self.get_client()
-        url = f"{self.base_url}/api/{endpoint.lstrip('/')}"
+        url = self._api_base.join(endpoint.lstrip('/'))
+
+        etag_key = None
+        cached = None
+        headers = None
+        if method == "GET":
+            etag_key = str(url.copy_merge_params(params) if params else url)
+            cached = self._etags.get(etag_key)
+            if cached is not None:
+                headers = {"If-None-Match": cached[0]}
 
         try:
-            response = await client.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json_data,
-                files=files
-            )
+            for attempt in range(RATE_LIMIT_RETRIES + 1):
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.acquire()
+                async with self._semaphore:
+                    response = await client.request(
+                        method=method,
+                        url=url,
+                        params=params,
+                        json=json_data,
+                        files=files,
+                        headers=headers
+                    )
+                if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+                    break
+                # Rate limited: the request was not processed, so it is safe to resend
+                await asyncio.sleep(_retry_delay(response, attempt))
+            if response.status_code == 304 and cached is not None:
+                self._etags.move_to_end(etag_key)
+                return json_loads(cached[1])
             response.raise_for_status()
             
             # Handle empty responses (e.g., 204 No Content)
             # Some endpoints return empty responses even for successful requests
             try:
-                return response.json()
+                data = json_loads(response.content)
             except Exception:
                 # If response is empty, return empty dict
                 return {}
+
+            if etag_key is not None:
+                self._remember_etag(etag_key, response.headers.get("ETag"), response.content)
+            return data
         except httpx.HTTPStatusError as e:
             raise e
         except Exception as e:
             raise e
 
+    def _remember_etag(self, key: str, etag: Optional[str], content: bytes):
+        """Keep a GET response for revalidation, evicting the least recently used."""
+        if not etag:
+            self._etags.pop(key, None)
+            return
+        self._etags[key] = (etag, content)
+        self._etags.move_to_end(key)
+        while len(self._etags) > ETAG_CACHE_SIZE:
+            self._etags.popitem(last=False)
+
     async def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
         """GET request helper."""
         return await self.request("GET", endpoint, params=params)
@@ -83,8 +222,12 @@ class PlankaAPIClient:
 
 # ==================== AUTHENTICATION ====================
 
-async def initialize_auth() -> str:
-    """Initialize authentication and return access token."""
+async def initialize_auth(api_client: Optional[PlankaAPIClient] = None) -> str:
+    """Initialize authentication and return access token.
+
+    When api_client is given, an email/password login goes through its
+    connection pool so the connection is kept for subsequent requests.
+    """
     load_dotenv()
 
     base_url = os.getenv("PLANKA_BASE_URL")
@@ -105,10 +248,14 @@ async def initialize_auth() -> str:
     email = os.getenv("PLANKA_EMAIL")
     password = os.getenv("PLANKA_PASSWORD")
     if email and password:
+        credentials = {"emailOrUsername": email, "password": password}
+        if api_client is not None:
+            data = await api_client.post("access-tokens", credentials)
+            return data["item"]["accessToken"]
         async with httpx.AsyncClient() as client:
             response = await client.post(
                 f"{base_url}/api/access-tokens",
-                json={"emailOrUsername": email, "password": password}
+                json=credentials
             )
             response.raise_for_status()
             data = response.json()
@@ -117,4 +264,30 @@ async def initialize_auth() -> str:
     raise ValueError(
         "No authentication method configured. Set one of: "
         "PLANKA_API_TOKEN, PLANKA_API_KEY, or PLANKA_EMAIL+PLANKA_PASSWORD"
-    )
\ No newline at end of file
+    )
+
+async def create_api_client() -> PlankaAPIClient:
+    """Create the shared API client and authenticate it."""
+    load_dotenv()
+
+    base_url = os.getenv("PLANKA_BASE_URL")
+    if not base_url:
+        raise ValueError("PLANKA_BASE_URL not set in environment")
+
+    max_concurrency_env = os.getenv("PLANKA_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY))
+    try:
+        max_concurrency = int(max_concurrency_env)
+    except ValueError:
+        max_concurrency = 0
+    if max_concurrency < 1:
+        raise ValueError(
+            f"PLANKA_MAX_CONCURRENCY must be a positive integer, got {max_concurrency_env!r}"
+        )
+    rate_limit = float(os.getenv("PLANKA_RATE_LIMIT", DEFAULT_RATE_LIMIT))
+    api_client = PlankaAPIClient(base_url, "", max_concurrency, rate_limit)
+    try:
+        api_client.set_auth_token(await initialize_auth(api_client))
+    except BaseException:
+        await api_client.close()
+        raise
+    return api_client
@@ -1,19 +1,32 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import partial
+from itertools import islice
+import asyncio
+import heapq
 import time
 
+from .utils import json_dumps
+
 # ==================== CACHE SYSTEM ====================
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """Single cache entry with TTL."""
     data: Any
-    timestamp: float
-    ttl: int  # seconds
+    expiry_ts: float  # time.monotonic() deadline, i.e. creation time + TTL
+    hits: int = 0
+    # Serialized form of data, built on first use and dropped with the entry
+    serialized_json: Optional[str] = None
+    # Rendered Markdown form of data, same lifetime as serialized_json
+    rendered_markdown: Optional[str] = None
+    # Named lookup structures derived from data, same lifetime as serialized_json
+    indexes: Optional[Dict[str, Any]] = None
 
     def is_valid(self) -> bool:
         """Check if cache entry is still valid."""
-        return time.time() - self.timestamp < self.ttl
+        return time.monotonic() < self.expiry_ts
 
 class PlankaCache:
     """Multi-tier caching system optimized for low-concurrency environment."""
@@ -22,11 +35,27 @@ class PlankaCache:
         # Workspace structure (projects, boards, lists, labels, users)
         self.workspace: Optional[CacheEntry] = None
 
-        # Board overview caches {board_id: CacheEntry}
-        self.board_overviews: Dict[str, CacheEntry] = {}
+        # Board overview caches {board_id: CacheEntry}, least recently used first
+        self.board_overviews: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.max_board_cache_size = 50
+
+        # Search index over the cards of all boards (see get_search_index)
+        self.search_index: Optional[CacheEntry] = None
+
+        # Per-card detail caches {card_id: CacheEntry}, least recently used first
+        self.card_details: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        # Min-heap of (expiry time, card_id) for cheap TTL cleanup
+        self._card_expiry: List[Tuple[float, str]] = []
+        # Card cache size limits: above max, evict down to trim size
+        self.max_card_cache_size = 100
+        self.card_cache_trim_size = 50
+        # Reverse index {task_id: card_id} of tasks seen on fetched cards, so
+        # task changes can invalidate the card they belong to
+        self.task_to_card: Dict[str, str] = {}
 
-        # Per-card detail caches {card_id: CacheEntry}
-        self.card_details: Dict[str, CacheEntry] = {}
+        # In-flight fetches {cache key: Future}, so concurrent misses for the
+        # same key share one fetch instead of each calling the API
+        self._inflight: Dict[str, asyncio.Task] = {}
 
         # Statistics for monitoring
         self.stats = {
@@ -36,6 +65,8 @@ class PlankaCache:
             "board_overview_misses": 0,
             "card_hits": 0,
             "card_misses": 0,
+            "search_index_hits": 0,
+            "search_index_misses": 0,
         }
 
     async def get_workspace(self, fetch_func):
@@ -45,23 +76,94 @@ class PlankaCache:
             return self.workspace.data
 
         self.stats["workspace_misses"] += 1
-        data = await fetch_func()
-        self.workspace = CacheEntry(data=data, timestamp=time.time(), ttl=300)
+        data = await self._fetch_once("workspace", fetch_func)
+        self.workspace = CacheEntry(data=data, expiry_ts=time.monotonic() + 300)
+        return data
+
+    def peek_workspace(self) -> Optional[Dict]:
+        """Return the cached workspace structure if still valid, without fetching."""
+        if self.workspace and self.workspace.is_valid():
+            self.stats["workspace_hits"] += 1
+            return self.workspace.data
+        return None
+
+    async def refresh_workspace(self, fetch_func):
+        """Re-fetch workspace structure regardless of TTL (used to keep it warm)."""
+        data = await self._fetch_once("workspace", fetch_func)
+        self.workspace = CacheEntry(data=data, expiry_ts=time.monotonic() + 300)
         return data
 
+    async def get_workspace_json(self, fetch_func) -> str:
+        """Get workspace structure as indented JSON, serialized once per cache entry."""
+        data = await self.get_workspace(fetch_func)
+        entry = self.workspace
+        if entry is None or entry.data is not data:
+            return json_dumps(data)
+        if entry.serialized_json is None:
+            entry.serialized_json = json_dumps(data)
+        return entry.serialized_json
+
+    async def get_workspace_markdown(self, fetch_func, render_func) -> str:
+        """Get workspace structure as Markdown, rendered once per cache entry."""
+        data = await self.get_workspace(fetch_func)
+        entry = self.workspace
+        if entry is None or entry.data is not data:
+            return render_func(data)
+        if entry.rendered_markdown is None:
+            entry.rendered_markdown = render_func(data)
+        return entry.rendered_markdown
+
     async def get_board_overview(self, board_id: str, fetch_func):
         """Get board overview. TTL: 3 minutes. Expected hit rate: 70-80%"""
         if board_id in self.board_overviews:
             entry = self.board_overviews[board_id]
             if entry.is_valid():
                 self.stats["board_overview_hits"] += 1
+                self.board_overviews.move_to_end(board_id)
                 return entry.data
 
         self.stats["board_overview_misses"] += 1
-        data = await fetch_func()
+        data = await self._fetch_once(f"board:{board_id}", fetch_func)
+        self.put_board_overview(board_id, data)
+        return data
+
+    def get_board_index(self, board_id: str, data, name: str, build_func):
+        """Get a lookup structure derived from a board overview, built once per cache entry.
+
+        data is the board overview as returned by get_board_overview; if it is
+        no longer the cached one, the index is built without being kept.
+        """
+        entry = self.board_overviews.get(board_id)
+        if entry is None or entry.data is not data:
+            return build_func(data)
+        if entry.indexes is None:
+            entry.indexes = {}
+        if name not in entry.indexes:
+            entry.indexes[name] = build_func(data)
+        return entry.indexes[name]
+
+    def put_board_overview(self, board_id: str, data):
+        """Store a board overview that was fetched elsewhere, e.g. by a workspace fetch."""
         self.board_overviews[board_id] = CacheEntry(
-            data=data, timestamp=time.time(), ttl=180
+            data=data, expiry_ts=time.monotonic() + 180
         )
+        self.board_overviews.move_to_end(board_id)
+        while len(self.board_overviews) > self.max_board_cache_size:
+            self.board_overviews.popitem(last=False)
+
+    async def get_search_index(self, fetch_func):
+        """Get the workspace-wide card search index. TTL: 1 minute.
+
+        Dropped whenever a board or card is invalidated, so searches never
+        see cards older than the last change made through this server.
+        """
+        if self.search_index and self.search_index.is_valid():
+            self.stats["search_index_hits"] += 1
+            return self.search_index.data
+
+        self.stats["search_index_misses"] += 1
+        data = await self._fetch_once("search_index", fetch_func)
+        self.search_index = CacheEntry(data=data, expiry_ts=time.monotonic() + 60)
         return data
 
     async def get_card(self, card_id: str, fetch_func):
@@ -70,15 +172,92 @@ class PlankaCache:
             entry = self.card_details[card_id]
             if entry.is_valid():
                 self.stats["card_hits"] += 1
+                self.card_details.move_to_end(card_id)
+                entry.hits += 1
                 return entry.data
 
         self.stats["card_misses"] += 1
-        data = await fetch_func()
-        self.card_details[card_id] = CacheEntry(
-            data=data, timestamp=time.time(), ttl=60
-        )
+        data = await self._fetch_once(f"card:{card_id}", fetch_func)
+        entry = CacheEntry(data=data, expiry_ts=time.monotonic() + 60)
+        self.card_details[card_id] = entry
+        for task_list in data.get('taskLists') or ():
+            for task in task_list.get('tasks') or ():
+                self.remember_task(task['id'], card_id)
+        self.card_details.move_to_end(card_id)
+        heapq.heappush(self._card_expiry, (entry.expiry_ts, card_id))
+        self.cleanup_card_cache()
         return data
 
+    async def get_card_json(self, card_id: str, fetch_func) -> str:
+        """Get card details as indented JSON, serialized once per cache entry."""
+        data = await self.get_card(card_id, fetch_func)
+        entry = self.card_details.get(card_id)
+        if entry is None or entry.data is not data:
+            return json_dumps(data)
+        if entry.serialized_json is None:
+            entry.serialized_json = json_dumps(data)
+        return entry.serialized_json
+
+    async def _fetch_once(self, key: str, fetch_func):
+        """Run fetch_func, or wait for the fetch already in flight for key."""
+        task = self._inflight.get(key)
+        if task is None:
+            # The fetch runs in its own task, so no caller owns it: cancelling
+            # any caller (the one that started it included) leaves the others
+            # waiting on a fetch that still completes
+            task = asyncio.ensure_future(fetch_func())
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._fetch_done, key))
+        return await asyncio.shield(task)
+
+    def _fetch_done(self, key: str, task: asyncio.Future):
+        """Forget a finished shared fetch."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark as retrieved so a failure nobody waited for is not logged
+            task.exception()
+
+    def patch_board_card(self, board_id: str, card: Dict):
+        """Add or replace a card in a cached board overview (call after card writes).
+
+        Saves refetching the whole board after a single card changed. The board
+        keeps its original expiry; indexes derived from it are rebuilt.
+        """
+        entry = self.board_overviews.get(board_id)
+        if entry is not None and entry.is_valid():
+            included = entry.data.setdefault("included", {})
+            # Copy, so a listing iterating the old list is not affected
+            cards = list(included.get("cards") or [])
+            for i, cached_card in enumerate(cards):
+                if cached_card.get("id") == card["id"]:
+                    cards[i] = {**cached_card, **card}
+                    break
+            else:
+                cards.append(card)
+            included["cards"] = cards
+            entry.indexes = entry.serialized_json = entry.rendered_markdown = None
+        self.search_index = None
+
+    def card_board_id(self, card_id: str) -> Optional[str]:
+        """Board a card is on according to the cached card or board overviews."""
+        entry = self.card_details.get(card_id)
+        if entry is not None and entry.data.get("boardId"):
+            return entry.data["boardId"]
+        for board_id, entry in self.board_overviews.items():
+            cards = entry.data.get("included", {}).get("cards") or ()
+            if any(card.get("id") == card_id for card in cards):
+                return board_id
+        return None
+
+    def patch_card(self, card_id: str, fields: Dict):
+        """Update fields of a cached card in place of invalidating it."""
+        entry = self.card_details.get(card_id)
+        if entry is not None and entry.is_valid():
+            entry.data = {**entry.data, **fields}
+            entry.serialized_json = entry.rendered_markdown = None
+        self.search_index = None
+
     def invalidate_workspace(self):
         """Invalidate workspace cache (call after structural changes)."""
         self.workspace = None
@@ -87,19 +266,49 @@ class PlankaCache:
         """Invalidate board overview cache (call after board changes)."""
         if board_id in self.board_overviews:
             del self.board_overviews[board_id]
+        self.search_index = None
+
+    def invalidate_boards(self):
+        """Invalidate all board overviews (when the changed board is not known)."""
+        self.board_overviews.clear()
+        self.search_index = None
 
     def invalidate_card(self, card_id: str):
         """Invalidate card cache (call after card updates)."""
         if card_id in self.card_details:
             del self.card_details[card_id]
+        self.search_index = None
+
+    def remember_task(self, task_id: str, card_id: str):
+        """Record which card a task belongs to (see invalidate_task)."""
+        self.task_to_card[task_id] = card_id
+
+    def invalidate_task(self, task_id: str):
+        """Invalidate the cached card a task belongs to, if that card is known."""
+        card_id = self.task_to_card.get(task_id)
+        if card_id is not None:
+            self.invalidate_card(card_id)
+
+    def invalidate_search_index(self):
+        """Invalidate the card search index."""
+        self.search_index = None
 
     def cleanup_card_cache(self):
-        """Remove old entries to limit memory usage."""
-        if len(self.card_details) > 100:
-            # Sort by timestamp (oldest first)
-            sorted_entries = sorted(
-                self.card_details.items(),
-                key=lambda x: x[1].timestamp
-            )
-            # Keep only the 50 most recent
-            self.card_details = dict(sorted_entries[-50:])
\ No newline at end of file
+        """Remove expired entries and evict to limit memory usage."""
+        # Pop expired cards off the expiry heap; records for cards that were
+        # re-fetched or invalidated since are stale and simply dropped
+        now = time.monotonic()
+        while self._card_expiry and self._card_expiry[0][0] <= now:
+            expiry, card_id = heapq.heappop(self._card_expiry)
+            entry = self.card_details.get(card_id)
+            if entry is not None and entry.expiry_ts == expiry:
+                del self.card_details[card_id]
+
+        if len(self.card_details) <= self.max_card_cache_size:
+            return
+
+        # v-LRU: among the least recently used 10%, evict the least hit card
+        while len(self.card_details) > self.card_cache_trim_size:
+            window = islice(self.card_details.items(), max(1, len(self.card_details) // 10))
+            card_id, _ = min(window, key=lambda item: item[1].hits)
+            del self.card_details[card_id]
@@ -1,7 +1,7 @@
-from .workspace import planka_get_workspace, fetch_workspace_data
+from .workspace import planka_get_workspace, fetch_workspace_data, keep_workspace_warm
 from .cards import planka_list_cards, planka_get_card, planka_create_card, planka_update_card, planka_delete_card
 from .search import planka_find_and_get_card
-from .tasks_labels import planka_add_task, planka_update_task, planka_add_card_label, planka_remove_card_label, planka_delete_task
+from .tasks_labels import planka_add_task, planka_update_task, planka_add_card_label, planka_add_card_labels_bulk, planka_remove_card_label, planka_delete_task
 
 __all__ = [
     'planka_get_workspace',
@@ -14,7 +14,9 @@ __all__ = [
     'planka_add_task',
     'planka_update_task',
     'planka_add_card_label',
+    'planka_add_card_labels_bulk',
     'planka_remove_card_label',
     'planka_delete_task',
-    'fetch_workspace_data'
+    'fetch_workspace_data',
+    'keep_workspace_warm'
 ]
\ No newline at end of file
@@ -1,13 +1,58 @@
-import json
+from functools import partial
 from typing import List, Dict, Any, Optional
 from ..models import ListCardsInput, GetCardInput, CreateCardInput, UpdateCardInput, DeleteCardInput, ResponseFormat, DetailLevel
-from ..utils import ResponseFormatter, PaginationHelper, handle_api_error
+from ..utils import ResponseFormatter, PaginationHelper, build_context, build_label_cards_map, handle_api_error, json_dumps
 from ..api_client import PlankaAPIClient
 from ..cache import PlankaCache
 
 from .. import instances # Import the instances module itself
 from .workspace import fetch_workspace_data
 
+# ==================== HELPER FUNCTIONS ====================
+
+async def fetch_full_card(card_id: str) -> Dict:
+    """Fetch a card with its tasks, comments and attachments merged in.
+
+    This is the form cards are stored in the card cache.
+    """
+    card_detail = await instances.api_client.get(f"cards/{card_id}")
+    full_card = card_detail.get("item", {})
+    included = card_detail.get("included", {})
+
+    # Merge included data into card
+    full_card['taskLists'] = included.get('taskLists', [])
+    full_card['comments'] = included.get('comments', [])
+    full_card['attachments'] = included.get('attachments', [])
+    full_card['_included_labels'] = included.get('labels', [])
+    full_card['_included_users'] = included.get('users', [])
+    full_card['_included_cardLabels'] = included.get('cardLabels', [])
+
+    return full_card
+
+def _board_label_cards(board_detail: Dict) -> Dict:
+    """Label ID -> card IDs index of a board overview (see PlankaCache.get_board_index)."""
+    return build_label_cards_map(board_detail.get("included", {}).get("cardLabels") or [])
+
+def board_context(board_detail: Dict) -> Dict:
+    """Formatting context of a board overview: id maps and the cardLabels grouping."""
+    # The board overview carries everything; no workspace lookup needed
+    return build_context(
+        {}, board_detail.get("included", {}), board_name=board_detail.get("item", {}).get("name")
+    )
+
+def card_context(card: Dict, workspace: Dict) -> Dict:
+    """Formatting context for a single card.
+
+    Uses the labels, users and card labels included with the card (see
+    fetch_full_card), falling back to the workspace-wide maps.
+    """
+    included = {
+        'labels': card.get('_included_labels'),
+        'users': card.get('_included_users'),
+        'cardLabels': card.get('_included_cardLabels'),
+    }
+    return build_context(workspace, included, board_id=card.get('boardId'))
+
 # ==================== TOOLS ====================
 
 async def planka_list_cards(params: ListCardsInput) -> str:
@@ -29,38 +74,19 @@ async def planka_list_cards(params: ListCardsInput) -> str:
         - "Find all Critical bugs" → board_id="X", label_filter="Critical"
         - Use detail_level="preview" for quick browsing (saves 88% tokens vs detailed)
     """
-    if instances.api_client is None:
-        return handle_api_error(RuntimeError("API client not initialized"))
+    if instances.api_client is None or instances.cache is None:
+        return handle_api_error(RuntimeError("API client or Cache not initialized"))
 
     try:
-        # Fetch board details (includes lists, labels, cards)
-        board_detail = await instances.api_client.get(f"boards/{params.board_id}")
+        # Fetch board details (includes lists, labels, cards); repeat listings
+        # of the same board are served from the board cache
+        board_detail = await instances.cache.get_board_overview(
+            params.board_id, partial(instances.api_client.get, f"boards/{params.board_id}")
+        )
         board = board_detail.get("item", {})
         included = board_detail.get("included", {})
 
-        # Build context maps for formatters
-        lists_map = {lst["id"]: lst for lst in included.get("lists", [])}
-        labels_map = {lbl["id"]: lbl for lbl in included.get("labels", [])}
-        users_map = {usr["id"]: usr for usr in included.get("users", [])}
-
-        # Build card labels mapping from cardLabels join table
-        # Planka uses normalized structure: cardLabels = [{id, cardId, labelId}, ...]
-        card_labels_map = {}
-        for card_label in included.get("cardLabels", []):
-            card_id = card_label.get("cardId")
-            label_id = card_label.get("labelId")
-            if card_id and label_id:
-                if card_id not in card_labels_map:
-                    card_labels_map[card_id] = []
-                card_labels_map[card_id].append(label_id)
-
-        context = {
-            'lists': lists_map,
-            'labels': labels_map,
-            'users': users_map,
-            'card_labels': card_labels_map,
-            'board_name': board.get("name", "Unknown Board")
-        }
+        is_markdown = params.response_format == ResponseFormat.MARKDOWN
 
         # Get all cards from included with defensive programming
         cards = included.get("cards", [])
@@ -69,29 +95,41 @@ async def planka_list_cards(params: ListCardsInput) -> str:
         if cards is None:
             cards = []
 
-        # Filter by list if specified
-        if params.list_id:
-            cards = [c for c in cards if c.get('listId') == params.list_id]
+        # Filter lazily; only the requested page is materialized
+        list_id = params.list_id
+        if list_id:
+            cards = (c for c in cards if c.get('listId') == list_id)
 
         # Filter by label if specified (case-insensitive partial match)
         if params.label_filter:
             label_lower = params.label_filter.lower()
-            cards = [
-                c for c in cards
-                if any(
-                    label_lower in labels_map.get(label_id, {}).get('name', '').lower()
-                    for label_id in card_labels_map.get(c.get('id'), [])
-                )
-            ]
+            # Match label names once, then test each card's labels by ID
+            matching_label_ids = {
+                label["id"] for label in included.get("labels", [])
+                if label_lower in (label.get('name') or '').lower()
+            }
+            # Collect the cards carrying them from the board's label -> cards
+            # index, built once per cached board
+            label_cards = instances.cache.get_board_index(
+                params.board_id, board_detail, "label_cards", _board_label_cards
+            )
+            matching_card_ids = set().union(
+                *(label_cards.get(label_id, ()) for label_id in matching_label_ids)
+            )
+            cards = (c for c in cards if c.get('id') in matching_card_ids)
 
         # Paginate
-        paginated = PaginationHelper.paginate_results(
+        paginated = PaginationHelper.paginate_iter(
             cards,
             params.offset,
             params.limit
         )
 
-        if params.response_format == ResponseFormat.MARKDOWN:
+        if is_markdown:
+            # Built once per cached board, not on every listing
+            context = instances.cache.get_board_index(
+                params.board_id, board_detail, "context", board_context
+            )
             content = ResponseFormatter.format_card_list_markdown(
                 paginated["items"],
                 context,
@@ -103,14 +141,14 @@ async def planka_list_cards(params: ListCardsInput) -> str:
                 content += f"\n\n---\n**Pagination**: Showing {paginated['count']} of {paginated['total']} cards. "
                 content += f"Use offset={paginated['next_offset']} to see more.\n"
         else:
-            content = json.dumps({
+            content = json_dumps({
                 "board": {
                     "id": board["id"],
                     "name": board.get("name", "Unknown Board")
                 },
                 "cards": paginated["items"],
                 "pagination": paginated
-            }, indent=2)
+            })
 
         return ResponseFormatter.truncate_response(content)
 
@@ -137,63 +175,21 @@ async def planka_get_card(params: GetCardInput) -> str:
         return handle_api_error(RuntimeError("API client or Cache not initialized"))
 
     try:
-        # Fetch card with caching
-        async def fetch_card():
-            card_detail = await instances.api_client.get(f"cards/{params.card_id}")
-            full_card = card_detail.get("item", {})
-            included = card_detail.get("included", {})
+        fetch_card = partial(fetch_full_card, params.card_id)
 
-            # Merge included data into card
-            full_card['taskLists'] = included.get('taskLists', [])
-            full_card['comments'] = included.get('comments', [])
-            full_card['attachments'] = included.get('attachments', [])
-            full_card['_included_labels'] = included.get('labels', [])
-            full_card['_included_users'] = included.get('users', [])
-            full_card['_included_cardLabels'] = included.get('cardLabels', [])
-
-            return full_card
+        # JSON output needs no context; repeat requests reuse the serialized card
+        if params.response_format == ResponseFormat.JSON:
+            content = await instances.cache.get_card_json(params.card_id, fetch_card)
+            return ResponseFormatter.truncate_response(content)
 
+        # Fetch card with caching
         card = await instances.cache.get_card(params.card_id, fetch_card)
 
         # Build context from workspace
         workspace = await instances.cache.get_workspace(fetch_workspace_data)
+        context = card_context(card, workspace)
 
-        # Use included data if available, otherwise use workspace data
-        labels_map = {lbl["id"]: lbl for lbl in card.get('_included_labels', [])}
-        if not labels_map:
-            labels_map = workspace.get('labels', {})
-
-        users_map = {usr["id"]: usr for usr in card.get('_included_users', [])}
-        if not users_map:
-            users_map = workspace.get('users', {})
-
-        # Build card labels mapping from cardLabels join table
-        card_labels_map = {}
-        included_card_labels = card.get('_included_cardLabels', [])
-        if included_card_labels:
-            for card_label in included_card_labels:
-                card_id = card_label.get("cardId")
-                label_id = card_label.get("labelId")
-                if card_id and label_id:
-                    if card_id not in card_labels_map:
-                        card_labels_map[card_id] = []
-                    card_labels_map[card_id].append(label_id)
-        else:
-            card_labels_map = workspace.get('card_labels', {})
-
-        context = {
-            'lists': workspace.get('lists', {}),
-            'labels': labels_map,
-            'users': users_map,
-            'card_labels': card_labels_map,
-            'board_name': workspace.get('boards', {}).get(card.get('boardId'), {}).get('name', 'Unknown Board')
-        }
-
-        if params.response_format == ResponseFormat.MARKDOWN:
-            content = ResponseFormatter.format_card_detailed(card, context)
-        else:
-            content = json.dumps(card, indent=2)
-
+        content = ResponseFormatter.format_card_detailed(card, context)
         return ResponseFormatter.truncate_response(content)
 
     except Exception as e:
@@ -245,8 +241,11 @@ async def planka_create_card(params: CreateCardInput) -> str:
         response = await instances.api_client.post(f"lists/{params.list_id}/cards", card_data)
         card = response.get("item", {})
 
-        # Invalidate board cache (board now has new card)
-        instances.cache.invalidate_board(board_id)
+        # Add the new card to the cached board rather than refetching it
+        if card.get('id'):
+            instances.cache.patch_board_card(board_id, card)
+        else:
+            instances.cache.invalidate_board(board_id)
 
         # Return minimal confirmation
         return f"✓ Created card: **{card.get('name', 'Untitled')}** (ID: `{card.get('id', 'N/A')}`)"
@@ -292,14 +291,25 @@ async def planka_update_card(params: UpdateCardInput) -> str:
         if params.position is not None:
             update_data["position"] = params.position
 
+        # A move may cross boards; remember where the card was listed before
+        previous_board_id = None
+        if params.list_id is not None:
+            previous_board_id = instances.cache.card_board_id(params.card_id)
+
         # Update card
         response = await instances.api_client.patch(f"cards/{params.card_id}", update_data)
         card = response.get("item", {})
 
-        # Invalidate caches
-        instances.cache.invalidate_card(params.card_id)
-        if card.get('boardId'):
-            instances.cache.invalidate_board(card['boardId'])
+        # Mirror the updated fields into the cached card and board
+        if card.get('id') and card.get('boardId'):
+            instances.cache.patch_card(params.card_id, card)
+            instances.cache.patch_board_card(card['boardId'], card)
+        else:
+            instances.cache.invalidate_card(params.card_id)
+            if card.get('boardId'):
+                instances.cache.invalidate_board(card['boardId'])
+        if previous_board_id and previous_board_id != card.get('boardId'):
+            instances.cache.invalidate_board(previous_board_id)
 
         # Build confirmation message
         updates = []
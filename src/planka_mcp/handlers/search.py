@@ -1,7 +1,9 @@
-import json
+import asyncio
+import sys
+from functools import partial
 from typing import List, Dict, Any, Optional
 from ..models import FindAndGetCardInput, ResponseFormat
-from ..utils import ResponseFormatter, handle_api_error
+from ..utils import ResponseFormatter, handle_api_error, json_dumps
 from ..api_client import PlankaAPIClient
 from ..cache import PlankaCache
 
@@ -9,6 +11,63 @@ from .. import instances # Import the instances module itself
 
 # Import fetch_workspace_data from workspace module
 from .workspace import fetch_workspace_data
+from .cards import board_context, card_context, fetch_full_card
+
+# ==================== HELPER FUNCTIONS ====================
+
+def _search_blob(card: Dict) -> str:
+    """Casefolded name and description of a card, as matched by searches."""
+    # NUL separator: a query cannot match across the name/description boundary
+    return f"{(card.get('name') or '').casefold()}\0{(card.get('description') or '').casefold()}"
+
+async def build_search_index(workspace: Optional[Dict] = None) -> Dict[str, Any]:
+    """Fetch every board concurrently and index its cards for substring search.
+
+    Boards are taken from workspace, or from the cached workspace if not given.
+    Returns {"entries": [(search blob, card), ...], "complete": bool}; boards
+    that fail to load are skipped and mark the index incomplete.
+    """
+    if workspace is None:
+        workspace = await instances.cache.get_workspace(fetch_workspace_data)
+
+    async def get_board(board_id: str) -> Dict:
+        # Boards loaded with the workspace are usually still in the board cache;
+        # the API client bounds how many of the misses are fetched at once
+        return await instances.cache.get_board_overview(
+            board_id, partial(instances.api_client.get, f"boards/{board_id}")
+        )
+
+    board_ids = list(workspace.get("boards", {}))
+    board_details = await asyncio.gather(
+        *(get_board(board_id) for board_id in board_ids),
+        return_exceptions=True
+    )
+    failures = [d for d in board_details if isinstance(d, BaseException)]
+    # Skip boards that could not be fetched, unless none could
+    if failures and len(failures) == len(board_details):
+        raise failures[0]
+    for board_id, board_detail in zip(board_ids, board_details):
+        if isinstance(board_detail, BaseException):
+            print(f"Search skipped board {board_id}: {board_detail}", file=sys.stderr, flush=True)
+
+    entries = [
+        (_search_blob(card), card)
+        for board_detail in board_details
+        if not isinstance(board_detail, BaseException)
+        for card in board_detail.get("included", {}).get("cards") or []
+    ]
+    return {"entries": entries, "complete": not failures}
+
+def _board_workspace(board_id: str, board_detail: Dict) -> Dict:
+    """Workspace-shaped lookups (lists, labels, users, boards) of a single board."""
+    context = board_context(board_detail)
+    return {
+        'lists': context['lists'],
+        'labels': context['labels'],
+        'users': context['users'],
+        'card_labels': context['card_labels'],
+        'boards': {board_id: {'id': board_id, 'name': context['board_name']}},
+    }
 
 # ==================== TOOLS ====================
 
@@ -32,12 +91,15 @@ async def planka_find_and_get_card(params: FindAndGetCardInput) -> str:
         return handle_api_error(RuntimeError("API client or Cache not initialized"))
 
     try:
-        query_lower = params.query.lower()
+        query_folded = params.query.casefold()
         matching_cards = []
+        workspace = None
 
-        # If board_id specified, search only that board
+        # If board_id specified, search only that board (through the board cache)
         if params.board_id:
-            board_detail = await instances.api_client.get(f"boards/{params.board_id}")
+            board_detail = await instances.cache.get_board_overview(
+                params.board_id, partial(instances.api_client.get, f"boards/{params.board_id}")
+            )
             cards = board_detail.get("included", {}).get("cards", [])
             
             # Ensure cards is always a list, never None
@@ -45,75 +107,50 @@ async def planka_find_and_get_card(params: FindAndGetCardInput) -> str:
                 cards = []
 
             # Search in card name and description
-            matching_cards = [
-                c for c in cards
-                if query_lower in c.get('name', '').lower()
-                or query_lower in (c.get('description') or '').lower()
-            ]
+            matching_cards = [c for c in cards if query_folded in _search_blob(c)]
         else:
-            # Search across all boards - fetch workspace
+            # Search across all boards via the cached workspace-wide index
             workspace = await instances.cache.get_workspace(fetch_workspace_data)
-
-            # Search each board
-            for board_id in workspace.get("boards", {}).keys():
-                board_detail = await instances.api_client.get(f"boards/{board_id}")
-                cards = board_detail.get("included", {}).get("cards", [])
-
-                matching_cards.extend([
-                    c for c in cards
-                    if query_lower in c.get('name', '').lower()
-                    or query_lower in (c.get('description') or '').lower()
-                ])
+            index = await instances.cache.get_search_index(partial(build_search_index, workspace))
+            if not index["complete"]:
+                # Some boards could not be fetched; do not keep serving a partial index
+                instances.cache.invalidate_search_index()
+            matching_cards = [card for blob, card in index["entries"] if query_folded in blob]
 
         # If no matches, return message
         if not matching_cards:
             return f"No cards found matching query: '{params.query}'"
 
+        if workspace is None:
+            # Board-scoped search: the board overview has every lookup the
+            # formatters need, so the full workspace is never downloaded
+            workspace = _board_workspace(params.board_id, board_detail)
+
         # If single match, return full details
         if len(matching_cards) == 1:
             card = matching_cards[0]
-            # Fetch full card details
-            card_detail = await instances.api_client.get(f"cards/{card['id']}")
-            full_card = card_detail.get("item", {})
-            included = card_detail.get("included", {})
 
-            # Build context
-            workspace = await instances.cache.get_workspace(fetch_workspace_data)
+            if not params.fetch_full:
+                # Render the card as found on its board; no extra request
+                if params.response_format == ResponseFormat.JSON:
+                    return json_dumps(card)
+                return ResponseFormatter.format_card_detailed(card, card_context(card, workspace))
 
-            # Build card labels mapping from cardLabels join table
-            card_labels_map = {}
-            for card_label in included.get("cardLabels", []):
-                card_id = card_label.get("cardId")
-                label_id = card_label.get("labelId")
-                if card_id and label_id:
-                    if card_id not in card_labels_map:
-                        card_labels_map[card_id] = []
-                    card_labels_map[card_id].append(label_id)
-
-            context = {
-                'lists': workspace.get('lists', {}),
-                'labels': {lbl["id"]: lbl for lbl in included.get("labels", [])},
-                'users': {usr["id"]: usr for usr in included.get("users", [])},
-                'card_labels': card_labels_map,
-                'board_name': workspace.get('boards', {}).get(full_card.get('boardId'), {}).get('name', 'Unknown Board')
-            }
-
-            # Merge included data into card
-            full_card['taskLists'] = included.get('taskLists', [])
-            full_card['comments'] = included.get('comments', [])
-            full_card['attachments'] = included.get('attachments', [])
+            # Fetch full card details through the card cache
+            full_card = await instances.cache.get_card(card['id'], partial(fetch_full_card, card['id']))
 
             if params.response_format == ResponseFormat.MARKDOWN:
-                return ResponseFormatter.format_card_detailed(full_card, context)
+                return ResponseFormatter.format_card_detailed(full_card, card_context(full_card, workspace))
             else:
-                return json.dumps(full_card, indent=2)
+                return json_dumps({k: v for k, v in full_card.items() if not k.startswith('_included_')})
 
         # Multiple matches - return list to choose from
-        workspace = await instances.cache.get_workspace(fetch_workspace_data)
         output = f"# Found {len(matching_cards)} matching cards\n\n"
+        lists = workspace.get('lists', {})
+        boards = workspace.get('boards', {})
         for card in matching_cards[:10]:  # Limit to first 10
-            list_name = workspace.get('lists', {}).get(card.get('listId'), {}).get('name', 'Unknown List')
-            board_name = workspace.get('boards', {}).get(card.get('boardId'), {}).get('name', 'Unknown Board')
+            list_name = lists.get(card.get('listId'), {}).get('name', 'Unknown List')
+            board_name = boards.get(card.get('boardId'), {}).get('name', 'Unknown Board')
             output += f"- **{card.get('name', 'Untitled')}** (ID: `{card['id']}`)\n"
             output += f"  - Board: {board_name}\n"
             output += f"  - List: {list_name}\n\n"
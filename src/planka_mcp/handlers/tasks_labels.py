@@ -1,5 +1,6 @@
+import asyncio
 from typing import List, Dict, Any, Optional
-from ..models import AddTaskInput, UpdateTaskInput, AddCardLabelInput, RemoveCardLabelInput, DeleteTaskInput
+from ..models import AddTaskInput, UpdateTaskInput, AddCardLabelInput, AddCardLabelsBulkInput, RemoveCardLabelInput, DeleteTaskInput
 from ..utils import ResponseFormatter, handle_api_error
 from ..api_client import PlankaAPIClient
 from ..cache import PlankaCache
@@ -7,7 +8,23 @@ from ..cache import PlankaCache
 from .. import instances # Import the instances module itself
 
 # Import fetch_workspace_data from workspace module
-from .workspace import fetch_workspace_data
+from .workspace import fetch_workspace_data, warm_workspace_soon
+
+# ==================== HELPER FUNCTIONS ====================
+
+def invalidate_task_card(task_id: str, task: Dict):
+    """Invalidate the cached card a task belongs to.
+
+    Uses the task's cardId when Planka returns one, otherwise the cache's
+    task -> card index; if neither knows the card it expires within 1 minute.
+    """
+    if instances.cache is None:
+        return
+    card_id = task.get("cardId")
+    if card_id:
+        instances.cache.invalidate_card(card_id)
+    else:
+        instances.cache.invalidate_task(task_id)
 
 # ==================== TOOLS ====================
 
@@ -39,8 +56,10 @@ async def planka_add_task(params: AddTaskInput) -> str:
         )
         task = task_response.get("item", {})
 
-        # Invalidate card cache
+        # Invalidate card cache; remember the new task's card for later updates
         instances.cache.invalidate_card(params.card_id)
+        if 'id' in task:
+            instances.cache.remember_task(task['id'], params.card_id)
 
         return f"✓ Added task: **{task.get('name', 'Unnamed')}** (Task ID: `{task.get('id', 'N/A')}`)"
 
@@ -73,9 +92,7 @@ async def planka_update_task(params: UpdateTaskInput) -> str:
         )
         task = response.get("item", {})
 
-        # Invalidate card cache (task belongs to card via task list)
-        # Note: We'd need to track card_id, but for now we'll leave it
-        # The cache will expire naturally within 1 minute
+        invalidate_task_card(params.task_id, task)
 
         status = "complete" if params.is_completed else "incomplete"
         check = "[x]" if params.is_completed else "[ ]"
@@ -104,24 +121,40 @@ async def planka_delete_task(params: DeleteTaskInput) -> str:
         return handle_api_error(RuntimeError("API client not initialized"))
 
     try:
-        # Get task details first to get task name for confirmation
-        # The API client now handles empty responses gracefully
-        task_response = await instances.api_client.get(f"tasks/{params.task_id}")
-        task = task_response.get("item", {}) if task_response else {}
+        # Delete task using DELETE /api/tasks/{taskId}; Planka answers with
+        # the deleted task, which gives its name and card without a prior read
+        response = await instances.api_client.delete(f"tasks/{params.task_id}")
+        task = (response or {}).get("item") or {}
         task_name = task.get("name", f"Task {params.task_id}")
 
-        # Delete the task using DELETE /api/tasks/{taskId}
-        # The API client now handles empty responses (204 No Content) gracefully
-        await instances.api_client.delete(f"tasks/{params.task_id}")
-
-        # Note: We'd need to track card_id for cache invalidation, but for now we'll leave it
-        # The cache will expire naturally within 1 minute
+        invalidate_task_card(params.task_id, task)
 
         return f"✓ Deleted task: **{task_name}** (ID: `{params.task_id}`)"
 
     except Exception as e:
         return handle_api_error(e)
 
+def cached_label(label_id: str, response: Optional[Dict] = None) -> Dict:
+    """Look up a label without waiting for a workspace fetch.
+
+    Uses the cached workspace, else a label included in the API response. On
+    a cold cache the workspace is fetched in the background for later calls.
+    """
+    workspace = instances.cache.peek_workspace()
+    if workspace is not None:
+        return workspace.get('labels', {}).get(label_id, {})
+
+    warm_workspace_soon()
+    included = (response or {}).get('included', {}).get('labels', [])
+    return next((label for label in included if label.get('id') == label_id), {})
+
+def invalidate_label_board(label: Dict):
+    """Drop the cached card labels of the label's board (all boards if unknown)."""
+    if label.get('boardId'):
+        instances.cache.invalidate_board(label['boardId'])
+    else:
+        instances.cache.invalidate_boards()
+
 async def planka_add_card_label(params: AddCardLabelInput) -> str:
     """Add a label to a card."
 
@@ -148,18 +181,70 @@ async def planka_add_card_label(params: AddCardLabelInput) -> str:
             {"labelId": params.label_id}
         )
 
-        # Get workspace to find label name
-        workspace = await instances.cache.get_workspace(fetch_workspace_data)
-        label_name = workspace.get('labels', {}).get(params.label_id, {}).get('name', 'Unknown')
+        label = cached_label(params.label_id, response)
+        label_name = label.get('name', 'Unknown')
 
-        # Invalidate card cache
+        # Invalidate card cache and the board's cached card labels
         instances.cache.invalidate_card(params.card_id)
+        invalidate_label_board(label)
 
         return f"✓ Added label **{label_name}** to card (Label ID: `{params.label_id}`)"
 
     except Exception as e:
         return handle_api_error(e)
 
+async def planka_add_card_labels_bulk(params: AddCardLabelsBulkInput) -> str:
+    """Add several labels to cards in one call.
+
+    Sends all label assignments concurrently and reads the workspace once for
+    label names. Each assignment succeeds or fails on its own.
+
+    Args:
+        params (AddCardLabelsBulkInput): Card ID / label ID pairs
+
+    Returns:
+        str: Per-assignment confirmation or error, with a success count
+
+    Examples:
+        - "Label cards abc and xyz as 'Critical'" → Two assignments, one call
+        - "Tag all migrated cards with 'Imported'" → One assignment per card
+    """
+    if instances.api_client is None or instances.cache is None:
+        return handle_api_error(RuntimeError("API client or Cache not initialized"))
+
+    try:
+        workspace = await instances.cache.get_workspace(fetch_workspace_data)
+        labels = workspace.get('labels', {})
+
+        results = await asyncio.gather(
+            *(
+                instances.api_client.post(f"cards/{a.card_id}/labels", {"labelId": a.label_id})
+                for a in params.assignments
+            ),
+            return_exceptions=True
+        )
+
+        lines = []
+        added = 0
+        for assignment, result in zip(params.assignments, results):
+            label = labels.get(assignment.label_id, {})
+            label_name = label.get('name', 'Unknown')
+            if isinstance(result, BaseException):
+                lines.append(f"- ✗ **{label_name}** on card `{assignment.card_id}`: {handle_api_error(result)}")
+                continue
+
+            added += 1
+            # Invalidate card cache and the board's cached card labels
+            instances.cache.invalidate_card(assignment.card_id)
+            invalidate_label_board(label)
+            lines.append(f"- ✓ Added **{label_name}** to card `{assignment.card_id}` (Label ID: `{assignment.label_id}`)")
+
+        header = f"Added {added} of {len(params.assignments)} labels\n\n"
+        return header + "\n".join(lines)
+
+    except Exception as e:
+        return handle_api_error(e)
+
 async def planka_remove_card_label(params: RemoveCardLabelInput) -> str:
     """Remove a label from a card."
 
@@ -179,15 +264,15 @@ async def planka_remove_card_label(params: RemoveCardLabelInput) -> str:
         return handle_api_error(RuntimeError("API client or Cache not initialized"))
 
     try:
-        # Get workspace to find label name before removing
-        workspace = await instances.cache.get_workspace(fetch_workspace_data)
-        label_name = workspace.get('labels', {}).get(params.label_id, {}).get('name', 'Unknown')
-
         # Remove label from card
-        await instances.api_client.delete(f"cards/{params.card_id}/labels/{params.label_id}")
+        response = await instances.api_client.delete(f"cards/{params.card_id}/labels/{params.label_id}")
+
+        label = cached_label(params.label_id, response)
+        label_name = label.get('name', 'Unknown')
 
-        # Invalidate card cache
+        # Invalidate card cache and the board's cached card labels
         instances.cache.invalidate_card(params.card_id)
+        invalidate_label_board(label)
 
         return f"✓ Removed label **{label_name}** from card (Label ID: `{params.label_id}`)"
 
@@ -1,7 +1,8 @@
-import json
+import asyncio
+import sys
 from typing import Dict, Any
 from ..models import GetWorkspaceInput, ResponseFormat
-from ..utils import ResponseFormatter, handle_api_error
+from ..utils import ResponseFormatter, build_card_labels_map, handle_api_error
 from ..api_client import PlankaAPIClient
 from ..cache import PlankaCache
 
@@ -9,18 +10,36 @@ from .. import instances # Import the instances module itself
 
 # ==================== HELPER FUNCTIONS ====================
 
+# Refresh shortly before the 5 minute workspace TTL runs out
+WORKSPACE_REFRESH_INTERVAL = 270
+
+async def _gather_or_cancel(coros) -> list:
+    """Run coroutines concurrently; on the first failure cancel the rest and re-raise.
+
+    Plain gather() leaves the other requests running after one fails. This
+    gives the all-or-nothing behaviour of a TaskGroup on Python 3.10 too.
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
 async def fetch_workspace_data() -> Dict:
     """Fetch complete workspace structure (projects, boards, lists, labels, users)."""
     if instances.api_client is None:
         raise RuntimeError("API client not initialized")
     
     try:
-        # Fetch all projects
-        projects_response = await instances.api_client.get("projects")
+        # Fetch all projects and all users concurrently
+        projects_response, users_response = await asyncio.gather(
+            instances.api_client.get("projects"),
+            instances.api_client.get("users")
+        )
         projects = projects_response.get("items", [])
-
-        # Fetch all users
-        users_response = await instances.api_client.get("users")
         users = users_response.get("items", [])
         users_map = {user["id"]: user for user in users}
 
@@ -28,55 +47,94 @@ async def fetch_workspace_data() -> Dict:
         boards_map = {}
         lists_map = {}
         labels_map = {}
-        card_labels_map = {}
-
-        for project in projects:
-            # Get project details (includes boards)
-            project_detail = await instances.api_client.get(f"projects/{project['id']}")
-            project_boards = project_detail.get("included", {}).get("boards", [])
-
-            for board_summary in project_boards:
-                # Get board details (includes lists, labels, cards)
-                board_detail = await instances.api_client.get(f"boards/{board_summary['id']}")
-                board = board_detail.get("item", {})
-                included = board_detail.get("included", {})
-
-                # Store board
-                boards_map[board["id"]] = {
-                    "id": board["id"],
-                    "name": board.get("name", "Unnamed Board"),
-                    "projectId": board.get("projectId"),
-                    "project_name": project.get("name", "Unknown Project")
-                }
 
-                # Store lists
-                for lst in included.get("lists", []):
-                    lists_map[lst["id"]] = {
-                        "id": lst["id"],
-                        "name": lst.get("name", "Unnamed List"),
-                        "boardId": lst.get("boardId"),
-                        "board_name": board.get("name", "Unknown Board"),
-                        "position": lst.get("position", 0)
-                    }
-
-                # Store labels
-                for label in included.get("labels", []):
-                    labels_map[label["id"]] = {
-                        "id": label["id"],
-                        "name": label.get("name", "Unnamed Label"),
-                        "color": label.get("color", "gray"),
-                        "boardId": label.get("boardId"),
-                        "board_name": board.get("name", "Unknown Board")
-                    }
-                
-                # Store cardLabels
-                for card_label in included.get("cardLabels", []):
-                    card_id = card_label.get("cardId")
-                    label_id = card_label.get("labelId")
-                    if card_id and label_id:
-                        if card_id not in card_labels_map:
-                            card_labels_map[card_id] = []
-                        card_labels_map[card_id].append(label_id)
+        included_boards = projects_response.get("included", {}).get("boards")
+        if included_boards is not None:
+            # The project list already carries the boards of every project
+            boards_by_project = {}
+            for board_summary in included_boards:
+                boards_by_project.setdefault(board_summary.get("projectId"), []).append(board_summary)
+            project_boards = [
+                (project, board_summary)
+                for project in projects
+                for board_summary in boards_by_project.get(project["id"], [])
+            ]
+        else:
+            # Get project details (includes boards) for all projects concurrently
+            project_details = await _gather_or_cancel(
+                instances.api_client.get(f"projects/{project['id']}") for project in projects
+            )
+            project_boards = [
+                (project, board_summary)
+                for project, project_detail in zip(projects, project_details)
+                for board_summary in project_detail.get("included", {}).get("boards", [])
+            ]
+
+        # Get board details (includes lists, labels, cards) for all boards concurrently
+        board_details = await _gather_or_cancel(
+            instances.api_client.get(f"boards/{board_summary['id']}") for _, board_summary in project_boards
+        )
+
+        for (project, board_summary), board_detail in zip(project_boards, board_details):
+            board = board_detail.get("item", {})
+            included = board_detail.get("included", {})
+
+            # Keep the full board (with cards) so board listings and searches
+            # right after a workspace fetch need no request of their own
+            if instances.cache is not None and "id" in board:
+                instances.cache.put_board_overview(board["id"], board_detail)
+
+            # Store board
+            boards_map[board["id"]] = {
+                "id": board["id"],
+                "name": board.get("name", "Unnamed Board"),
+                "projectId": board.get("projectId"),
+                "project_name": project.get("name", "Unknown Project")
+            }
+            board_name = board.get("name", "Unknown Board")
+
+            # Store lists
+            lists_map.update({
+                lst["id"]: {
+                    "id": lst["id"],
+                    "name": lst.get("name", "Unnamed List"),
+                    "boardId": lst.get("boardId"),
+                    "board_name": board_name,
+                    "position": lst.get("position", 0)
+                }
+                for lst in included.get("lists", [])
+            })
+
+            # Store labels
+            labels_map.update({
+                label["id"]: {
+                    "id": label["id"],
+                    "name": label.get("name", "Unnamed Label"),
+                    "color": label.get("color", "gray"),
+                    "boardId": label.get("boardId"),
+                    "board_name": board_name
+                }
+                for label in included.get("labels", [])
+            })
+
+        # Store cardLabels of all boards
+        card_labels_map = build_card_labels_map(
+            card_label
+            for board_detail in board_details
+            for card_label in board_detail.get("included", {}).get("cardLabels", [])
+        )
+
+        # Insert in display order so renderers can iterate the maps as-is and
+        # produce the same output for the same workspace on every refresh.
+        # Lists and labels already follow their board in Planka's own order.
+        boards_map = dict(sorted(
+            boards_map.items(),
+            key=lambda kv: (kv[1]["project_name"] or "", kv[1]["name"] or "")
+        ))
+        users_map = dict(sorted(
+            users_map.items(),
+            key=lambda kv: kv[1].get("name") or kv[1].get("username") or ""
+        ))
 
         return {
             "projects": projects,
@@ -89,6 +147,65 @@ async def fetch_workspace_data() -> Dict:
     except Exception as e:
         raise e
 
+def format_workspace_markdown(data: Dict[str, Any]) -> str:
+    """Format workspace data as readable Markdown."""
+    parts = ["# Planka Workspace\n\n", "## Projects\n"]
+    for project in data.get('projects', []):
+        parts.append(f"- **{project.get('name', 'Unnamed')}** (ID: `{project.get('id', 'N/A')}`)\n")
+
+    parts.append("\n## Boards\n")
+    for board_id, board in data.get('boards', {}).items():
+        parts.append(f"- **{board.get('name', 'Unnamed')}** (ID: `{board_id}`)\n")
+
+    parts.append("\n## Lists\n")
+    for list_id, lst in data.get('lists', {}).items():
+        parts.append(f"- **{lst.get('name', 'Unnamed')}** (ID: `{list_id}`)\n")
+
+    parts.append("\n## Labels\n")
+    for label_id, label in data.get('labels', {}).items():
+        parts.append(f"- **{label.get('name', 'Unnamed')}** (Color: {label.get('color', 'N/A')}, ID: `{label_id}`)\n")
+
+    parts.append("\n## Users\n")
+    for user_id, user in data.get('users', {}).items():
+        parts.append(f"- **{user.get('name', 'Unnamed')}** (ID: `{user_id}`)\n")
+
+    return "".join(parts)
+
+# Background workspace fetches started by warm_workspace_soon (referenced so
+# they are not garbage collected while running)
+_warmup_tasks = set()
+
+def _warmup_done(task: asyncio.Task):
+    _warmup_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        print(f"Workspace cache refresh failed: {task.exception()}", file=sys.stderr, flush=True)
+
+def warm_workspace_soon():
+    """Start fetching the workspace into the cache without waiting for it."""
+    task = asyncio.create_task(instances.cache.get_workspace(fetch_workspace_data))
+    _warmup_tasks.add(task)
+    task.add_done_callback(_warmup_done)
+
+async def keep_workspace_warm(interval: float = WORKSPACE_REFRESH_INTERVAL):
+    """Populate the workspace cache now and refresh it before it expires.
+
+    Runs until cancelled; meant to be started as a background task on server
+    startup so the first tool call does not pay for the full workspace fetch.
+    A refresh is skipped while the workspace has not been read since the last
+    one, so an idle server stops re-fetching every board.
+    """
+    stats = instances.cache.stats
+    refreshed_at_reads = None
+    while True:
+        reads = stats["workspace_hits"] + stats["workspace_misses"]
+        if reads != refreshed_at_reads:
+            try:
+                await instances.cache.refresh_workspace(fetch_workspace_data)
+                refreshed_at_reads = reads
+            except Exception as e:
+                print(f"Workspace cache refresh failed: {e}", file=sys.stderr, flush=True)
+        await asyncio.sleep(interval)
+
 # ==================== TOOLS ====================
 
 async def planka_get_workspace(params: GetWorkspaceInput) -> str:
@@ -116,32 +233,14 @@ async def planka_get_workspace(params: GetWorkspaceInput) -> str:
         raise RuntimeError("Cache not initialized")
 
     try:
-        data = await instances.cache.get_workspace(fetch_workspace_data)
-
         if params.response_format == ResponseFormat.JSON:
-            content = json.dumps(data, indent=2)
+            # Serialized once per cached workspace
+            content = await instances.cache.get_workspace_json(fetch_workspace_data)
         else:
-            # Format as readable Markdown
-            content = "# Planka Workspace\n\n"
-            content += "## Projects\n"
-            for project in data.get('projects', []):
-                content += f"- **{project.get('name', 'Unnamed')}** (ID: `{project.get('id', 'N/A')}`)\n"
-
-            content += "\n## Boards\n"
-            for board_id, board in data.get('boards', {}).items():
-                content += f"- **{board.get('name', 'Unnamed')}** (ID: `{board_id}`)\n"
-
-            content += "\n## Lists\n"
-            for list_id, lst in data.get('lists', {}).items():
-                content += f"- **{lst.get('name', 'Unnamed')}** (ID: `{list_id}`)\n"
-
-            content += "\n## Labels\n"
-            for label_id, label in data.get('labels', {}).items():
-                content += f"- **{label.get('name', 'Unnamed')}** (Color: {label.get('color', 'N/A')}, ID: `{label_id}`)\n"
-
-            content += "\n## Users\n"
-            for user_id, user in data.get('users', {}).items():
-                content += f"- **{user.get('name', 'Unnamed')}** (ID: `{user_id}`)\n"
+            # Rendered once per cached workspace
+            content = await instances.cache.get_workspace_markdown(
+                fetch_workspace_data, format_workspace_markdown
+            )
 
         return ResponseFormatter.truncate_response(content)
 
@@ -0,0 +1,124 @@
+"""
+Planka MCP Server - Direct MCP Protocol Entry Point
+
+This is a simplified entry point specifically for MCP protocol communication.
+It bypasses the FastAPI layer and connects directly to the MCP protocol.
+Installed as the ``planka-mcp`` console script.
+"""
+import sys
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from .api_client import create_api_client
+from .cache import PlankaCache
+from .handlers import (
+    planka_get_workspace, planka_list_cards, planka_find_and_get_card,
+    planka_get_card, planka_create_card, planka_update_card, planka_delete_card,
+    planka_add_task, planka_update_task, planka_add_card_label, planka_add_card_labels_bulk,
+    planka_remove_card_label, planka_delete_task, keep_workspace_warm
+)
+from . import instances
+from mcp.server.fastmcp import FastMCP
+
+@asynccontextmanager
+async def warm_workspace_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Keep the workspace cache warm for as long as the MCP server runs."""
+    warmup_task = asyncio.create_task(keep_workspace_warm())
+    try:
+        yield
+    finally:
+        warmup_task.cancel()
+
+# Create FastMCP instance
+mcp = FastMCP("planka_mcp", lifespan=warm_workspace_lifespan)
+
+# Register MCP tools: (tool name, handler, description)
+# Handlers are registered directly, without a forwarding wrapper per tool.
+TOOLS = [
+    ("planka_get_workspace", planka_get_workspace,
+     "Get complete workspace structure (projects, boards, lists, labels, users)."),
+    ("planka_list_cards", planka_list_cards,
+     "List cards with filtering and pagination options."),
+    ("planka_find_and_get_card", planka_find_and_get_card,
+     "Find and get card details by search query."),
+    ("planka_get_card", planka_get_card,
+     "Get detailed information about a specific card."),
+    ("planka_create_card", planka_create_card,
+     "Create a new card in a specified list."),
+    ("planka_update_card", planka_update_card,
+     "Update an existing card's properties."),
+    ("planka_add_task", planka_add_task,
+     "Add a task to a card."),
+    ("planka_update_task", planka_update_task,
+     "Update a task's completion status."),
+    ("planka_add_card_label", planka_add_card_label,
+     "Add a label to a card."),
+    ("planka_add_card_labels_bulk", planka_add_card_labels_bulk,
+     "Add several labels to cards in one call."),
+    ("planka_remove_card_label", planka_remove_card_label,
+     "Remove a label from a card."),
+    ("planka_delete_card", planka_delete_card,
+     "Delete a card from Planka."),
+    ("planka_delete_task", planka_delete_task,
+     "Delete a task from a card."),
+]
+
+for tool_name, handler, description in TOOLS:
+    mcp.tool(tool_name, description=description, structured_output=False)(handler)
+
+async def initialize_server():
+    """Initialize the server components."""
+    try:
+        # Create the authenticated API client and cache; instances is the
+        # single place handlers look them up
+        instances.api_client = await create_api_client()
+        base_url = instances.api_client.base_url
+        instances.cache = PlankaCache()
+        
+        sys.stderr.write(
+            "Planka MCP Server initialized successfully\n"
+            f"Connected to: {base_url}\n"
+            "Waiting for MCP protocol messages...\n"
+        )
+        sys.stderr.flush()
+        
+    except Exception as e:
+        print(f"Failed to initialize server: {e}", file=sys.stderr, flush=True)
+        raise
+
+async def cleanup_server():
+    """Clean up server resources."""
+    if instances.api_client:
+        await instances.api_client.close()
+        print("Planka MCP Server shut down successfully", file=sys.stderr, flush=True)
+
+async def main():
+    """Main entry point for MCP server."""
+    try:
+        await initialize_server()
+        await mcp.run_stdio_async()
+    except Exception as e:
+        print(f"Server error: {e}", file=sys.stderr, flush=True)
+        raise
+    finally:
+        await cleanup_server()
+
+def _event_loop_runner():
+    """Return uvloop's (winloop's on Windows) run() when installed, else asyncio.run."""
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl
+        else:
+            import uvloop as loop_impl
+    except ImportError:
+        return asyncio.run
+    return loop_impl.run
+
+def entry():
+    """Console script entry point."""
+    run = _event_loop_runner()
+    run(main())
+
+if __name__ == "__main__":
+    entry()
\ No newline at end of file
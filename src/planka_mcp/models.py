@@ -28,7 +28,7 @@ class GetWorkspaceInput(BaseModel):
     """Input for getting workspace structure."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
+        frozen=True,
         extra='forbid'
     )
 
@@ -41,7 +41,7 @@ class ListCardsInput(BaseModel):
     """Input for listing cards with cross-list and label filtering support."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
+        frozen=True,
         extra='forbid'
     )
 
@@ -89,7 +89,7 @@ class GetCardInput(BaseModel):
     """Input for getting a single card's details."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
+        frozen=True,
         extra='forbid'
     )
 
@@ -112,7 +112,7 @@ class CreateCardInput(BaseModel):
     """Input for creating a new card."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
+        frozen=True,
         extra='forbid'
     )
 
@@ -146,7 +146,7 @@ class UpdateCardInput(BaseModel):
     """Input for updating a card."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
+        frozen=True,
         extra='forbid'
     )
 
@@ -184,7 +184,7 @@ class AddTaskInput(BaseModel):
     """Input for adding a task to a card."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
+        frozen=True,
         extra='forbid'
     )
 
@@ -210,7 +210,7 @@ class UpdateTaskInput(BaseModel):
     """Input for updating a task."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
+        frozen=True,
         extra='forbid'
     )
 
@@ -229,7 +229,7 @@ class DeleteTaskInput(BaseModel):
     """Input for deleting a task."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
+        frozen=True,
         extra='forbid'
     )
 
@@ -244,7 +244,7 @@ class FindAndGetCardInput(BaseModel):
     """Input for finding and getting a card."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
+        frozen=True,
         extra='forbid'
     )
 
@@ -263,12 +263,17 @@ class FindAndGetCardInput(BaseModel):
         default=ResponseFormat.MARKDOWN,
         description="Output format: 'markdown' or 'json'"
     )
+    fetch_full: bool = Field(
+        default=True,
+        description="Fetch tasks, comments and attachments for a single match (default: true). "
+                    "Set false to answer from the search results alone, saving a request"
+    )
 
 class AddCardLabelInput(BaseModel):
     """Input for adding a label to a card."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
+        frozen=True,
         extra='forbid'
     )
 
@@ -285,11 +290,26 @@ class AddCardLabelInput(BaseModel):
         max_length=100
     )
 
+class AddCardLabelsBulkInput(BaseModel):
+    """Input for adding several labels to cards in one call."""
+    model_config = ConfigDict(
+        str_strip_whitespace=True,
+        frozen=True,
+        extra='forbid'
+    )
+
+    assignments: List[AddCardLabelInput] = Field(
+        ...,
+        description="Card ID / label ID pairs to add (get available labels from planka_get_workspace)",
+        min_length=1,
+        max_length=100
+    )
+
 class RemoveCardLabelInput(BaseModel):
     """Input for removing a label from a card."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
+        frozen=True,
         extra='forbid'
     )
 
@@ -310,7 +330,7 @@ class DeleteCardInput(BaseModel):
     """Input for deleting a card."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
+        frozen=True,
         extra='forbid'
     )
 
@@ -12,15 +12,16 @@ Optimized for token efficiency with aggressive caching and smart response format
 
 Requires: PLANKA_BASE_URL and authentication credentials in environment.
 """
-import os
 import sys
-import json
+import queue
+import asyncio
+import logging
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
-from .models import GetWorkspaceInput, ListCardsInput, GetCardInput, CreateCardInput, UpdateCardInput, FindAndGetCardInput, AddTaskInput, UpdateTaskInput, AddCardLabelInput, RemoveCardLabelInput, DeleteTaskInput
+from .models import GetWorkspaceInput, DeleteTaskInput
 from .cache import PlankaCache
-from .api_client import PlankaAPIClient, initialize_auth
-from .handlers import planka_get_workspace, planka_list_cards, planka_find_and_get_card, planka_get_card, planka_create_card, planka_update_card, planka_add_task, planka_update_task, planka_add_card_label, planka_remove_card_label, planka_delete_task, fetch_workspace_data
-from .utils import handle_api_error, ResponseFormatter
+from .api_client import create_api_client
+from .handlers import planka_get_workspace, planka_delete_task, keep_workspace_warm
 
 from . import instances # Import the instances module itself
 from mcp.server.fastmcp import FastMCP
@@ -28,6 +29,18 @@ from fastapi import FastAPI, APIRouter, Body
 
 mcp = FastMCP("planka_mcp")
 
+# Lifecycle messages go through a queue; a listener thread writes them to
+# stderr so the event loop never blocks on the stream
+logger = logging.getLogger("planka_mcp")
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, logging.StreamHandler(sys.stderr))
+logger.addHandler(QueueHandler(_log_queue))
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+# Background task keeping the workspace cache warm (started on startup)
+_warmup_task: Optional[asyncio.Task] = None
+
 # Create an API Router for your tools
 router = APIRouter()
 
@@ -62,22 +75,28 @@ app.include_router(router)
 @app.on_event("startup")
 async def startup_event():
     """Initialize API client and cache system on server startup."""
+    global _warmup_task
+    _log_listener.start()
     try:
-        token = await initialize_auth()
-        base_url = os.getenv("PLANKA_BASE_URL")
-
-        instances.api_client = PlankaAPIClient(base_url, token)
+        instances.api_client = await create_api_client()
+        base_url = instances.api_client.base_url
         instances.cache = PlankaCache()
+        _warmup_task = asyncio.create_task(keep_workspace_warm())
 
-        print(f"Planka MCP Server initialized successfully", file=sys.stderr, flush=True)
-        print(f"Connected to: {base_url}", file=sys.stderr, flush=True)
+        logger.info("Planka MCP Server initialized successfully")
+        logger.info("Connected to: %s", base_url)
     except Exception as e:
-        print(f"Failed to initialize server: {e}", file=sys.stderr, flush=True)
+        logger.error("Failed to initialize server: %s", e)
+        # Shutdown does not run after a failed startup; flush the queue here
+        _log_listener.stop()
         raise
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up resources on server shutdown."""
+    if _warmup_task is not None:
+        _warmup_task.cancel()
     if instances.api_client:
         await instances.api_client.close()
-        print("Planka MCP Server shut down successfully", file=sys.stderr, flush=True)
+        logger.info("Planka MCP Server shut down successfully")
+    _log_listener.stop()
@@ -1,32 +1,141 @@
 import json
 import httpx
-from typing import List, Dict, Any, Optional
+from collections import defaultdict
+from dataclasses import dataclass
+from itertools import islice
+from typing import Callable, Final, Iterable, List, Dict, Any, Optional, Set
 from .models import ResponseFormat, DetailLevel
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
+# ==================== JSON ====================
+
+def json_dumps(obj: Any) -> str:
+    """Serialize to indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2)
+
+def json_loads(data: Any) -> Any:
+    """Parse JSON from bytes or str, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # ==================== ERROR HANDLING ====================
 
+_HTTP_STATUS_MESSAGES: Dict[int, str] = {
+    401: "Error: Invalid API credentials. Check your access token or API key in the .env file.",
+    403: "Error: You don't have permission to access this resource. You may need board membership.",
+    404: "Error: Resource not found. Check that the ID is correct and the resource exists.",
+    429: "Error: Rate limit exceeded. Wait a moment before trying again.",
+}
+
+def _format_http_status_error(e: httpx.HTTPStatusError) -> str:
+    status = e.response.status_code
+    message = _HTTP_STATUS_MESSAGES.get(status)
+    if message is None:
+        return f"Error: API request failed (HTTP {status}). Please try again."
+    return message
+
+# Exception type -> message builder; subclasses resolve via their MRO
+_ERROR_FORMATTERS: Dict[type, Callable[[Exception], str]] = {
+    httpx.HTTPStatusError: _format_http_status_error,
+    httpx.TimeoutException: lambda e: "Error: Request timed out. The Planka server may be slow or unreachable.",
+    httpx.ConnectError: lambda e: "Error: Cannot connect to Planka server. Check the PLANKA_BASE_URL in your .env file.",
+}
+
 def handle_api_error(e: Exception) -> str:
     """Consistent, actionable error messages."""
-    if isinstance(e, httpx.HTTPStatusError):
-        status = e.response.status_code
-        if status == 401:
-            return "Error: Invalid API credentials. Check your access token or API key in the .env file."
-        elif status == 403:
-            return "Error: You don't have permission to access this resource. You may need board membership."
-        elif status == 404:
-            return "Error: Resource not found. Check that the ID is correct and the resource exists."
-        elif status == 429:
-            return "Error: Rate limit exceeded. Wait a moment before trying again."
-        else:
-            return f"Error: API request failed (HTTP {status}). Please try again."
-    elif isinstance(e, httpx.TimeoutException):
-        return "Error: Request timed out. The Planka server may be slow or unreachable."
-    elif isinstance(e, httpx.ConnectError):
-        return "Error: Cannot connect to Planka server. Check the PLANKA_BASE_URL in your .env file."
+    for error_type in type(e).__mro__:
+        formatter = _ERROR_FORMATTERS.get(error_type)
+        if formatter is not None:
+            return formatter(e)
     return f"Error: Unexpected error - {type(e).__name__}: {str(e)}"
 
+# ==================== PLANKA DATA ====================
+
+def build_card_labels_map(card_labels: Iterable[Dict]) -> Dict[str, List[str]]:
+    """Group Planka's cardLabels join table ({cardId, labelId} rows) into card ID -> label IDs."""
+    card_labels_map = defaultdict(list)
+    for card_label in card_labels:
+        card_id = card_label.get("cardId")
+        label_id = card_label.get("labelId")
+        if card_id and label_id:
+            card_labels_map[card_id].append(label_id)
+    return dict(card_labels_map)
+
+def build_label_cards_map(card_labels: Iterable[Dict]) -> Dict[str, Set[str]]:
+    """Invert Planka's cardLabels join table into label ID -> IDs of the cards carrying it."""
+    label_cards_map = defaultdict(set)
+    for card_label in card_labels:
+        card_id = card_label.get("cardId")
+        label_id = card_label.get("labelId")
+        if card_id and label_id:
+            label_cards_map[label_id].add(card_id)
+    return dict(label_cards_map)
+
+def build_context(
+    workspace: Dict,
+    included: Optional[Dict] = None,
+    board_id: Optional[str] = None,
+    board_name: Optional[str] = None
+) -> Dict:
+    """Build the formatting context used by the card formatters.
+
+    Lists, labels, users and cardLabels are taken from included (a Planka
+    "included" payload) where present, otherwise from the workspace maps,
+    which are used by reference. The board name defaults to the workspace
+    name of board_id.
+    """
+    included = included or {}
+
+    def by_id(key: str) -> Dict:
+        items = included.get(key)
+        return {item["id"]: item for item in items} if items else workspace.get(key, {})
+
+    card_labels = included.get("cardLabels")
+    return {
+        'lists': by_id('lists'),
+        'labels': by_id('labels'),
+        'users': by_id('users'),
+        'card_labels': build_card_labels_map(card_labels) if card_labels else workspace.get('card_labels', {}),
+        'board_name': board_name or workspace.get('boards', {}).get(board_id, {}).get('name', 'Unknown Board')
+    }
+
 # ==================== RESPONSE FORMATTING ====================
 
+# Placeholders shared by the card formatters
+UNTITLED_CARD: Final = 'Untitled'
+UNKNOWN_LIST: Final = 'Unknown List'
+NO_DUE_DATE: Final = 'No due date'
+
+def _names(items: Dict[str, Dict]) -> Dict[str, str]:
+    """Flatten an id -> object map into id -> name (objects without a name are skipped)."""
+    return {item_id: item['name'] for item_id, item in items.items() if 'name' in item}
+
+@dataclass(slots=True)
+class FormatCtx:
+    """Flat id -> name lookups derived once from a formatting context."""
+    list_names: Dict[str, str]
+    label_names: Dict[str, str]
+    user_names: Dict[str, str]
+    card_labels: Dict[str, List[str]]
+    board_name: str
+
+    @classmethod
+    def from_context(cls, context: Dict) -> "FormatCtx":
+        return cls(
+            list_names=_names(context.get('lists', {})),
+            label_names=_names(context.get('labels', {})),
+            user_names=_names(context.get('users', {})),
+            card_labels=context.get('card_labels', {}),
+            board_name=context.get('board_name', 'Unknown'),
+        )
+
 class ResponseFormatter:
     """Shared formatting logic for consistent outputs."""
 
@@ -37,11 +146,11 @@ class ResponseFormatter:
             return content
 
         truncate_at = int(limit * 0.6)
-        truncated = content[:truncate_at]
 
-        last_newline = truncated.rfind('\n')
-        if last_newline > truncate_at * 0.8:
-            truncated = truncated[:last_newline]
+        # Prefer cutting at a newline in the last 20% of the kept text; search
+        # only that window of the original instead of copying and scanning it all
+        last_newline = content.rfind('\n', int(truncate_at * 0.8) + 1, truncate_at)
+        truncated = content[:last_newline if last_newline >= 0 else truncate_at]
 
         warning = f"""
 ---
@@ -58,57 +167,56 @@ class ResponseFormatter:
     @staticmethod
     def format_task_progress(task_lists: List[Dict]) -> str:
         """Format task progress as 'completed/total'."""
-        total_tasks = 0
-        completed_tasks = 0
-        for task_list in task_lists:
-            for task in task_list.get('tasks', []):
-                total_tasks += 1
-                if task.get('isCompleted', False):
-                    completed_tasks += 1
+        total_tasks = sum(len(task_list.get('tasks', ())) for task_list in task_lists)
         if total_tasks == 0:
             return "0/0"
+        completed_tasks = sum(1 for task_list in task_lists
+                              for task in task_list.get('tasks', ())
+                              if task.get('isCompleted', False))
         return f"{completed_tasks}/{total_tasks}"
 
     @staticmethod
-    def format_card_preview(card: Dict, context: Dict) -> str:
+    def format_card_preview(card: Dict, context: Dict, names: Optional[FormatCtx] = None) -> str:
         """Format card in preview mode (~50 tokens)."""
-        list_name = context.get('lists', {}).get(card.get('listId'), {}).get('name', 'Unknown List')
+        names = names or FormatCtx.from_context(context)
+        list_name = names.list_names.get(card.get('listId'), UNKNOWN_LIST)
         # Get label IDs from card_labels mapping (cardLabels join table)
-        card_label_ids = context.get('card_labels', {}).get(card.get('id'), [])
-        labels = [context.get('labels', {}).get(label_id, {}).get('name', '')
-                  for label_id in card_label_ids]
+        label_names = names.label_names
+        labels = [label_names.get(label_id, '')
+                  for label_id in names.card_labels.get(card.get('id'), [])]
 
         task_progress = ResponseFormatter.format_task_progress(card.get('taskLists', []))
 
-        return f"""- **{card.get('name', 'Untitled')}** (ID: `{card.get('id', 'N/A')}`)
+        return f"""- **{card.get('name', UNTITLED_CARD)}** (ID: `{card.get('id', 'N/A')}`)
   - List: {list_name}
-  - Labels: {', '.join(labels) if labels else 'None'}
-  - Due: {card.get('dueDate', 'No due date')}
+  - Labels: {', '.join(labels) or 'None'}
+  - Due: {card.get('dueDate', NO_DUE_DATE)}
   - Tasks: {task_progress}
   - Comments: {len(card.get('comments', []))}
   - Attachments: {len(card.get('attachments', []))}"""
 
     @staticmethod
-    def format_card_summary(card: Dict, context: Dict) -> str:
+    def format_card_summary(card: Dict, context: Dict, names: Optional[FormatCtx] = None) -> str:
         """Format card in summary mode (~200 tokens)."""
-        list_name = context.get('lists', {}).get(card.get('listId'), {}).get('name', 'Unknown List')
+        names = names or FormatCtx.from_context(context)
+        list_name = names.list_names.get(card.get('listId'), UNKNOWN_LIST)
         # Get label IDs from card_labels mapping (cardLabels join table)
-        card_label_ids = context.get('card_labels', {}).get(card.get('id'), [])
-        labels = [context.get('labels', {}).get(label_id, {}).get('name', '')
-                  for label_id in card_label_ids]
-        members = [context.get('users', {}).get(user_id, {}).get('name', '')
-                   for user_id in card.get('memberIds', [])]
+        label_names = names.label_names
+        labels = [label_names.get(label_id, '')
+                  for label_id in names.card_labels.get(card.get('id'), [])]
+        user_names = names.user_names
+        members = [user_names.get(user_id, '') for user_id in card.get('memberIds', [])]
 
         task_progress = ResponseFormatter.format_task_progress(card.get('taskLists', []))
         description = card.get('description', '')
         desc_snippet = (description[:100] + '...') if len(description) > 100 else description
 
-        return f"""### {card.get('name', 'Untitled')}
+        return f"""### {card.get('name', UNTITLED_CARD)}
 **ID**: `{card.get('id', 'N/A')}`
 **List**: {list_name}
-**Labels**: {', '.join(labels) if labels else 'None'}
-**Members**: {', '.join(members) if members else 'None'}
-**Due Date**: {card.get('dueDate', 'No due date')}
+**Labels**: {', '.join(labels) or 'None'}
+**Members**: {', '.join(members) or 'None'}
+**Due Date**: {card.get('dueDate', NO_DUE_DATE)}
 **Created**: {card.get('createdAt', 'Unknown')}
 **Tasks**: {task_progress}
 **Comments**: {len(card.get('comments', []))}
@@ -118,68 +226,68 @@ class ResponseFormatter:
 """
 
     @staticmethod
-    def format_card_detailed(card: Dict, context: Dict) -> str:
+    def format_card_detailed(card: Dict, context: Dict, names: Optional[FormatCtx] = None) -> str:
         """Format card in detailed mode (~400 tokens)."""
-        list_name = context.get('lists', {}).get(card.get('listId'), {}).get('name', 'Unknown List')
+        names = names or FormatCtx.from_context(context)
+        list_name = names.list_names.get(card.get('listId'), UNKNOWN_LIST)
         # Get label IDs from card_labels mapping (cardLabels join table)
-        card_label_ids = context.get('card_labels', {}).get(card.get('id'), [])
-        labels = [context.get('labels', {}).get(label_id, {}).get('name', '')
-                  for label_id in card_label_ids]
-        members = [context.get('users', {}).get(user_id, {}).get('name', '')
-                   for user_id in card.get('memberIds', [])]
+        label_names = names.label_names
+        labels = [label_names.get(label_id, '')
+                  for label_id in names.card_labels.get(card.get('id'), [])]
+        user_names = names.user_names
+        members = [user_names.get(user_id, '') for user_id in card.get('memberIds', [])]
 
-        output = f"""# {card.get('name', 'Untitled')}
+        parts = [f"""# {card.get('name', UNTITLED_CARD)}
 
 **ID**: `{card.get('id', 'N/A')}`
 **List**: {list_name} (ID: `{card.get('listId', 'N/A')}`)
-**Board**: {context.get('board_name', 'Unknown')}
+**Board**: {names.board_name}
 
 ## Details
-- **Due Date**: {card.get('dueDate', 'No due date')}
+- **Due Date**: {card.get('dueDate', NO_DUE_DATE)}
 - **Created**: {card.get('createdAt', 'Unknown')}
 - **Updated**: {card.get('updatedAt', 'Unknown')}
 - **Position**: {card.get('position', 'N/A')}
 
 ## Members
-{', '.join(members) if members else '(No members assigned)'}
+{', '.join(members) or '(No members assigned)'}
 
 ## Labels
-{', '.join(labels) if labels else '(No labels)'}
+{', '.join(labels) or '(No labels)'}
 
 ## Description
 {card.get('description', '(No description)')}
 
 ## Tasks
-"""
+"""]
         task_lists = card.get('taskLists', [])
         if task_lists:
             for task_list in task_lists:
-                output += f"\n**{task_list.get('name', 'Tasks')}**:\n"
+                parts.append(f"\n**{task_list.get('name', 'Tasks')}**:\n")
                 for task in task_list.get('tasks', []):
                     check = '[x]' if task.get('isCompleted', False) else '[ ]'
-                    output += f"- {check} {task.get('name', 'Unnamed task')} (ID: `{task.get('id', 'N/A')}`)\n"
+                    parts.append(f"- {check} {task.get('name', 'Unnamed task')} (ID: `{task.get('id', 'N/A')}`)\n")
         else:
-            output += "(No tasks)\n"
+            parts.append("(No tasks)\n")
 
-        output += "\n## Comments\n"
+        parts.append("\n## Comments\n")
         comments = card.get('comments', [])
         if comments:
             for comment in comments:
-                user_id = comment.get('userId', 'Unknown')
-                user_name = context.get('users', {}).get(user_id, {}).get('name', 'Unknown User')
-                output += f"- **{user_name}** ({comment.get('createdAt', 'Unknown')}): {comment.get('text', '')}\n"
+                user_name = user_names.get(comment.get('userId', 'Unknown'), 'Unknown User')
+                parts.append(f"- **{user_name}** ({comment.get('createdAt', 'Unknown')}): {comment.get('text', '')}\n")
         else:
-            output += "(No comments)\n"
+            parts.append("(No comments)\n")
 
-        output += f"\n## Attachments\n"
+        parts.append("\n## Attachments\n")
         attachments = card.get('attachments', [])
         if attachments:
             for att in attachments:
-                output += f"- {att.get('name', 'Unnamed')} (ID: `{att.get('id', 'N/A')}`)\n"
+                parts.append(f"- {att.get('name', 'Unnamed')} (ID: `{att.get('id', 'N/A')}`)\n")
         else:
-            output += "(No attachments)\n"
+            parts.append("(No attachments)\n")
 
-        return output
+        return "".join(parts)
 
     @staticmethod
     def format_card_list_markdown(
@@ -191,17 +299,25 @@ class ResponseFormatter:
         if not cards:
             return "No cards found matching the criteria."
 
-        output = f"# Cards ({len(cards)} found)\n\n"
+        parts = [f"# Cards ({len(cards)} found)\n\n"]
+        # Resolve names once for the whole list rather than per card
+        names = FormatCtx.from_context(context)
+
+        # Pick the per-card formatter once, not per card
+        format_card, separator = _CARD_LIST_FORMATTERS.get(
+            detail_level, _CARD_LIST_FORMATTERS[DetailLevel.DETAILED]
+        )
+        parts.extend(format_card(card, context, names) + separator for card in cards)
 
-        for card in cards:
-            if detail_level == DetailLevel.PREVIEW:
-                output += ResponseFormatter.format_card_preview(card, context) + "\n\n"
-            elif detail_level == DetailLevel.SUMMARY:
-                output += ResponseFormatter.format_card_summary(card, context) + "\n"
-            else:  # DETAILED
-                output += ResponseFormatter.format_card_detailed(card, context) + "\n---\n\n"
+        return "".join(parts).strip()
 
-        return output.strip()
+
+# Detail level -> (card formatter, separator appended after each card)
+_CARD_LIST_FORMATTERS = {
+    DetailLevel.PREVIEW: (ResponseFormatter.format_card_preview, "\n\n"),
+    DetailLevel.SUMMARY: (ResponseFormatter.format_card_summary, "\n"),
+    DetailLevel.DETAILED: (ResponseFormatter.format_card_detailed, "\n---\n\n"),
+}
 
 
 # ==================== PAGINATION ====================
@@ -232,4 +348,22 @@ class PaginationHelper:
             "total": total,
             "has_more": offset + limit < total,
             "next_offset": offset + limit if offset + limit < total else None
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def paginate_iter(items: Iterable[Dict], offset: int, limit: int) -> Dict:
+        """Paginate a lazy iterable; only the requested page is kept in memory."""
+        iterator = iter(items)
+        skipped = sum(1 for _ in islice(iterator, offset))
+        page = list(islice(iterator, limit))
+        total = skipped + len(page) + sum(1 for _ in iterator)
+
+        return {
+            "items": page,
+            "offset": offset,
+            "limit": limit,
+            "count": len(page),
+            "total": total,
+            "has_more": offset + limit < total,
+            "next_offset": offset + limit if offset + limit < total else None
+        }
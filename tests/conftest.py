@@ -1,5 +1,6 @@
 """Pytest configuration and shared fixtures."""
 
+import json
 import pytest
 from unittest.mock import AsyncMock, Mock
 from datetime import datetime
@@ -23,8 +24,34 @@ def mock_cache():
     """Mock PlankaCache for testing."""
     cache = Mock(spec=PlankaCache)
     cache.get_workspace = AsyncMock()
-    cache.get_board_overview = AsyncMock()
+    cache.peek_workspace.return_value = None
+    cache.card_board_id.return_value = None
+
+    async def get_workspace_json(fetch_func):
+        return json.dumps(await cache.get_workspace(fetch_func), indent=2)
+
+    cache.get_workspace_json = AsyncMock(side_effect=get_workspace_json)
+
+    async def get_workspace_markdown(fetch_func, render_func):
+        return render_func(await cache.get_workspace(fetch_func))
+
+    cache.get_workspace_markdown = AsyncMock(side_effect=get_workspace_markdown)
+
+    async def get_search_index(fetch_func):
+        return await fetch_func()
+
+    cache.get_search_index = AsyncMock(side_effect=get_search_index)
+
+    async def get_board_overview(board_id, fetch_func):
+        return await fetch_func()
+
+    cache.get_board_overview = AsyncMock(side_effect=get_board_overview)
     cache.get_card = AsyncMock()
+
+    async def get_card_json(card_id, fetch_func):
+        return json.dumps(await cache.get_card(card_id, fetch_func), indent=2)
+
+    cache.get_card_json = AsyncMock(side_effect=get_card_json)
     cache.stats = {
         "workspace_hits": 0,
         "workspace_misses": 0,
@@ -1,8 +1,9 @@
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 import httpx
 
-from planka_mcp.api_client import PlankaAPIClient, initialize_auth
+from planka_mcp.api_client import PlankaAPIClient, RateLimiter, initialize_auth, create_api_client
 
 class TestPlankaAPIClient:
     """Test PlankaAPIClient functionality."""
@@ -15,7 +16,7 @@ class TestPlankaAPIClient:
         with patch('httpx.AsyncClient') as mock_async_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = {"data": "success"}
+            mock_response.content = b'{"data": "success"}'
             
             instance = mock_async_client.return_value
             instance.request = AsyncMock(return_value=mock_response)
@@ -23,6 +24,146 @@ class TestPlankaAPIClient:
             response = await client.request("GET", "test")
             assert response == {"data": "success"}
 
+    @pytest.mark.asyncio
+    async def test_request_url_keeps_base_path(self):
+        """Test that endpoints resolve under /api of a base URL with a path prefix."""
+        client = PlankaAPIClient("https://test.planka.com/planka/", "test-token")
+
+        with patch('httpx.AsyncClient') as mock_async_client:
+            mock_response = MagicMock()
+            mock_response.content = b'{}'
+
+            instance = mock_async_client.return_value
+            instance.request = AsyncMock(return_value=mock_response)
+
+            await client.request("GET", "/boards/board1")
+            url = instance.request.call_args.kwargs["url"]
+            assert str(url) == "https://test.planka.com/planka/api/boards/board1"
+
+    @pytest.mark.asyncio
+    async def test_request_concurrency_is_bounded(self):
+        """Test that no more than max_concurrency requests are in flight at once."""
+        client = PlankaAPIClient("https://test.planka.com", "test-token", max_concurrency=2)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_request(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            response = MagicMock()
+            response.content = b'{}'
+            return response
+
+        with patch('httpx.AsyncClient') as mock_async_client:
+            mock_async_client.return_value.request = fake_request
+            await asyncio.gather(*(client.get(f"cards/card{i}") for i in range(5)))
+
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_request_retries_rate_limited_requests(self):
+        """Test that HTTP 429 responses are retried after the server's Retry-After."""
+        client = PlankaAPIClient("https://test.planka.com", "test-token", rate_limit=0)
+        limited = MagicMock(status_code=429, headers={"Retry-After": "2"})
+        ok = MagicMock(status_code=200, content=b'{"item": {}}')
+
+        with patch('httpx.AsyncClient') as mock_async_client, \
+             patch("planka_mcp.api_client.asyncio.sleep", AsyncMock()) as mock_sleep:
+            mock_async_client.return_value.request = AsyncMock(side_effect=[limited, ok])
+            response = await client.post("cards/card1/labels", {"labelId": "label1"})
+
+        assert response == {"item": {}}
+        mock_sleep.assert_awaited_once_with(2.0)
+
+    @pytest.mark.asyncio
+    async def test_request_gives_up_after_rate_limit_retries(self):
+        """Test that a request still rate limited after all retries raises, backing off exponentially."""
+        client = PlankaAPIClient("https://test.planka.com", "test-token", rate_limit=0)
+        limited = MagicMock(status_code=429, headers={})
+        limited.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "Too Many Requests", request=MagicMock(), response=limited
+        )
+
+        with patch('httpx.AsyncClient') as mock_async_client, \
+             patch("planka_mcp.api_client.asyncio.sleep", AsyncMock()) as mock_sleep:
+            mock_async_client.return_value.request = AsyncMock(return_value=limited)
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get("boards/board1")
+
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [0.5, 1.0, 2.0]
+        assert mock_async_client.return_value.request.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_get_revalidates_with_etag(self):
+        """Test that a repeat GET sends If-None-Match and reuses the body on 304."""
+        client = PlankaAPIClient("https://test.planka.com", "test-token", rate_limit=0)
+        ok = MagicMock(status_code=200, content=b'{"item": {"id": "board1"}}', headers={"ETag": 'W/"v1"'})
+        not_modified = MagicMock(status_code=304, headers={"ETag": 'W/"v1"'})
+
+        with patch('httpx.AsyncClient') as mock_async_client:
+            instance = mock_async_client.return_value
+            instance.request = AsyncMock(side_effect=[ok, not_modified])
+            first = await client.get("boards/board1")
+            second = await client.get("boards/board1")
+
+        assert second == first
+        assert instance.request.await_args_list[0].kwargs["headers"] is None
+        assert instance.request.await_args_list[1].kwargs["headers"] == {"If-None-Match": 'W/"v1"'}
+        not_modified.raise_for_status.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_not_modified_body_is_unaffected_by_caller_changes(self):
+        """Test that changes to a returned body do not show up in a later 304 response."""
+        client = PlankaAPIClient("https://test.planka.com", "test-token", rate_limit=0)
+        ok = MagicMock(status_code=200, content=b'{"included": {"cards": [{"id": "card1"}]}}',
+                       headers={"ETag": 'W/"v1"'})
+        not_modified = MagicMock(status_code=304, headers={"ETag": 'W/"v1"'})
+
+        with patch('httpx.AsyncClient') as mock_async_client:
+            mock_async_client.return_value.request = AsyncMock(side_effect=[ok, not_modified])
+            first = await client.get("boards/board1")
+            first["included"]["cards"].append({"id": "local"})
+            second = await client.get("boards/board1")
+
+        assert second == {"included": {"cards": [{"id": "card1"}]}}
+
+    @pytest.mark.asyncio
+    async def test_etag_cache_is_bounded(self):
+        """Test that only the most recently used GET responses are kept for revalidation."""
+        client = PlankaAPIClient("https://test.planka.com", "test-token", rate_limit=0)
+
+        with patch('httpx.AsyncClient') as mock_async_client, \
+             patch("planka_mcp.api_client.ETAG_CACHE_SIZE", 2):
+            mock_async_client.return_value.request = AsyncMock(
+                return_value=MagicMock(status_code=200, content=b'{}', headers={"ETag": '"v1"'})
+            )
+            for board_id in ("board1", "board2", "board3"):
+                await client.get(f"boards/{board_id}")
+
+        assert list(client._etags) == [
+            "https://test.planka.com/api/boards/board2",
+            "https://test.planka.com/api/boards/board3",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_request_empty_body(self):
+        """Test that an empty body (e.g. 204 No Content) returns an empty dict."""
+        client = PlankaAPIClient("https://test.planka.com", "test-token")
+
+        with patch('httpx.AsyncClient') as mock_async_client:
+            mock_response = MagicMock()
+            mock_response.status_code = 204
+            mock_response.content = b''
+
+            instance = mock_async_client.return_value
+            instance.request = AsyncMock(return_value=mock_response)
+
+            response = await client.request("DELETE", "tasks/task1")
+            assert response == {}
+
     @pytest.mark.asyncio
     async def test_request_http_error(self):
         """Test an API request that returns an HTTP error."""
@@ -107,6 +248,84 @@ async def test_initialize_auth_with_email_password():
         token = await initialize_auth()
         assert token == "generated-token"
 
+@pytest.mark.asyncio
+async def test_create_api_client_logs_in_over_shared_client(monkeypatch):
+    """Test that email/password login reuses the client's pooled connection and sets its token."""
+    monkeypatch.setenv("PLANKA_BASE_URL", "https://test.planka.com")
+    monkeypatch.delenv("PLANKA_API_TOKEN", raising=False)
+    monkeypatch.delenv("PLANKA_API_KEY", raising=False)
+    monkeypatch.setenv("PLANKA_EMAIL", "test@example.com")
+    monkeypatch.setenv("PLANKA_PASSWORD", "password123")
+
+    with patch.object(
+        PlankaAPIClient, "post", AsyncMock(return_value={"item": {"accessToken": "generated-token"}})
+    ) as mock_post, patch("httpx.AsyncClient") as mock_async_client:
+        client = await create_api_client()
+
+    mock_post.assert_called_once_with(
+        "access-tokens", {"emailOrUsername": "test@example.com", "password": "password123"}
+    )
+    mock_async_client.assert_not_called()
+    assert client.auth_token == "generated-token"
+
+@pytest.mark.asyncio
+async def test_create_api_client_reads_max_concurrency(monkeypatch):
+    """Test that PLANKA_MAX_CONCURRENCY bounds the shared client's requests."""
+    monkeypatch.setenv("PLANKA_BASE_URL", "https://test.planka.com")
+    monkeypatch.setenv("PLANKA_API_TOKEN", "test-token")
+    monkeypatch.setenv("PLANKA_MAX_CONCURRENCY", "3")
+
+    client = await create_api_client()
+
+    assert client._semaphore._value == 3
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("value", ["0", "-2", "many"])
+async def test_create_api_client_rejects_invalid_max_concurrency(monkeypatch, value):
+    """Test that a PLANKA_MAX_CONCURRENCY below 1 or not a number fails with a clear error."""
+    monkeypatch.setenv("PLANKA_BASE_URL", "https://test.planka.com")
+    monkeypatch.setenv("PLANKA_API_TOKEN", "test-token")
+    monkeypatch.setenv("PLANKA_MAX_CONCURRENCY", value)
+
+    with pytest.raises(ValueError, match="PLANKA_MAX_CONCURRENCY must be a positive integer"):
+        await create_api_client()
+
+def test_client_rejects_max_concurrency_below_one():
+    """Test that a client that could never send a request is refused."""
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        PlankaAPIClient("https://test.planka.com", "test-token", max_concurrency=0)
+
+@pytest.mark.asyncio
+async def test_rate_limiter_allows_burst_then_throttles():
+    """Test that the token bucket lets a burst through and then spaces out requests."""
+    limiter = RateLimiter(2)
+    clock = [100.0]
+
+    async def fake_sleep(delay):
+        clock[0] += delay
+
+    with patch("planka_mcp.api_client.time.monotonic", lambda: clock[0]), \
+         patch("planka_mcp.api_client.asyncio.sleep", AsyncMock(side_effect=fake_sleep)) as mock_sleep:
+        limiter._updated = clock[0]
+        await limiter.acquire()
+        await limiter.acquire()
+        mock_sleep.assert_not_awaited()
+
+        await limiter.acquire()
+        mock_sleep.assert_awaited_once_with(0.5)
+
+@pytest.mark.asyncio
+async def test_set_auth_token_updates_open_client():
+    """Test that a new token is applied to an already created HTTP client."""
+    client = PlankaAPIClient("https://test.planka.com", "")
+
+    http_client = await client.get_client()
+    assert "Authorization" not in http_client.headers
+
+    client.set_auth_token("new-token")
+    assert http_client.headers["Authorization"] == "Bearer new-token"
+    await client.close()
+
 @pytest.mark.asyncio
 async def test_initialize_auth_no_credentials():
     """Test that initialize_auth raises ValueError when no authentication method is configured."""
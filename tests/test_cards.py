@@ -13,6 +13,8 @@ from planka_mcp.models import (
     ResponseFormat,
     DetailLevel,
 )
+from planka_mcp.cache import PlankaCache
+from planka_mcp.handlers import cards as cards_module
 from planka_mcp.handlers.cards import (
     planka_list_cards,
     planka_get_card,
@@ -25,6 +27,12 @@ from planka_mcp.handlers.cards import (
 class TestPlankaListCards:
     """Test planka_list_cards tool."""
 
+    @pytest.fixture(autouse=True)
+    def board_cache(self):
+        """Give every listing a fresh cache so board responses are not shared between tests."""
+        with patch("planka_mcp.instances.cache", PlankaCache()) as cache:
+            yield cache
+
     @pytest.mark.asyncio
     async def test_list_cards_success_preview(
         self, mock_planka_api_client, sample_board_response
@@ -90,7 +98,39 @@ class TestPlankaListCards:
             params = ListCardsInput(board_id="board1")
             result = await planka_list_cards(params)
             assert "Error" in result
-            assert "API client not initialized" in result
+            assert "API client or Cache not initialized" in result
+
+    @pytest.mark.asyncio
+    async def test_list_cards_reuses_cached_board(
+        self, mock_planka_api_client, sample_board_response, board_cache
+    ):
+        """Test that listing the same board again is served from the board cache until invalidated."""
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client):
+            mock_planka_api_client.get.return_value = sample_board_response
+            await planka_list_cards(ListCardsInput(board_id="board1"))
+            result = await planka_list_cards(ListCardsInput(board_id="board1", list_id="list1"))
+
+            assert "Test Card 1" in result
+            mock_planka_api_client.get.assert_called_once_with("boards/board1")
+
+            board_cache.invalidate_board("board1")
+            await planka_list_cards(ListCardsInput(board_id="board1"))
+            assert mock_planka_api_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_list_cards_builds_board_context_once(
+        self, mock_planka_api_client, sample_board_response
+    ):
+        """Test that the Markdown formatting context is built once per cached board."""
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
+             patch.object(cards_module, "board_context", wraps=cards_module.board_context) as build:
+            mock_planka_api_client.get.return_value = sample_board_response
+            first = await planka_list_cards(ListCardsInput(board_id="board1"))
+            second = await planka_list_cards(ListCardsInput(board_id="board1"))
+
+        assert first == second
+        assert "Bug" in first
+        build.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_list_cards_label_filter(self, mock_planka_api_client, sample_board_response):
@@ -112,7 +152,7 @@ class TestPlankaListCards:
             assert "Bug" in result
             
             # Test filtering by "Feature" label
-            params.label_filter = "Feature"
+            params = params.model_copy(update={"label_filter": "Feature"})
             result = await planka_list_cards(params)
             
             # Should only show card2 which has the "Feature" label
@@ -121,12 +161,26 @@ class TestPlankaListCards:
             assert "Feature" in result
             
             # Test filtering by non-existent label
-            params.label_filter = "Nonexistent"
+            params = params.model_copy(update={"label_filter": "Nonexistent"})
             result = await planka_list_cards(params)
             
             # Should show no cards message
             assert "No cards found" in result
 
+    @pytest.mark.asyncio
+    async def test_list_cards_label_filter_unnamed_label(self, mock_planka_api_client, sample_board_response):
+        """Test that labels without a name do not break label filtering."""
+        included = dict(sample_board_response["included"])
+        included["labels"] = included["labels"] + [{"id": "label_unnamed", "name": None}]
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client):
+            mock_planka_api_client.get.return_value = dict(sample_board_response, included=included)
+
+            params = ListCardsInput(board_id="board1", label_filter="Bug")
+            result = await planka_list_cards(params)
+
+            assert "Test Card 1" in result
+            assert "Test Card 2" not in result
+
     @pytest.mark.asyncio
     async def test_list_cards_pagination(self, mock_planka_api_client, sample_board_response):
         """Test card listing with pagination."""
@@ -323,6 +377,9 @@ class TestPlankaCreateCard:
             assert "Created card" in result
             assert "New Test Card" in result
             mock_planka_api_client.post.assert_called_once()
+            # The cached board gets the new card instead of being dropped
+            mock_cache.patch_board_card.assert_called_once_with("board1", created_card["item"])
+            mock_cache.invalidate_board.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_create_card_invalid_list_id(
@@ -385,6 +442,36 @@ class TestPlankaUpdateCard:
             assert "Updated Test Card" in result
             mock_planka_api_client.patch.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_update_card_patches_caches(self, mock_planka_api_client, mock_cache):
+        """Test that the updated card is mirrored into the card and board caches."""
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
+             patch("planka_mcp.instances.cache", mock_cache):
+            updated = {"id": "card1", "name": "Renamed", "boardId": "board1"}
+            mock_planka_api_client.patch.return_value = {"item": updated}
+
+            await planka_update_card(UpdateCardInput(card_id="card1", name="Renamed"))
+
+        mock_cache.patch_card.assert_called_once_with("card1", updated)
+        mock_cache.patch_board_card.assert_called_once_with("board1", updated)
+        mock_cache.invalidate_card.assert_not_called()
+        mock_cache.invalidate_board.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_move_card_to_another_board_invalidates_old_board(self, mock_planka_api_client, mock_cache):
+        """Test that moving a card across boards drops it from the old board's overview."""
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
+             patch("planka_mcp.instances.cache", mock_cache):
+            mock_cache.card_board_id.return_value = "board1"
+            moved = {"id": "card1", "listId": "list9", "boardId": "board2"}
+            mock_planka_api_client.patch.return_value = {"item": moved}
+
+            await planka_update_card(UpdateCardInput(card_id="card1", list_id="list9"))
+
+        mock_cache.card_board_id.assert_called_once_with("card1")
+        mock_cache.patch_board_card.assert_called_once_with("board2", moved)
+        mock_cache.invalidate_board.assert_called_once_with("board1")
+
     @pytest.mark.asyncio
     async def test_update_card_description(
         self, mock_planka_api_client, mock_cache, sample_card_data
@@ -1,5 +1,7 @@
 """Tests for core infrastructure: API client, caching, error handling, formatters."""
 
+import asyncio
+import json
 import pytest
 import time
 from unittest.mock import AsyncMock, Mock, patch
@@ -17,6 +19,7 @@ from planka_mcp import (
     handle_api_error,
     DetailLevel
 )
+from planka_mcp.utils import FormatCtx, build_card_labels_map, build_context, build_label_cards_map, json_dumps, json_loads
 
 
 class TestPlankaAPIClient:
@@ -41,6 +44,25 @@ class TestPlankaAPIClient:
         assert isinstance(http_client, httpx.AsyncClient)
         assert client._client is not None
 
+    @pytest.mark.asyncio
+    async def test_get_client_uses_http2_and_pool_limits(self):
+        """Test that the shared client enables HTTP/2 with explicit pool limits."""
+        from planka_mcp.api_client import DEFAULT_LIMITS
+
+        client = PlankaAPIClient("https://test.planka.com", "test-token")
+
+        with patch('httpx.AsyncClient') as mock_async_client, \
+             patch('httpx.AsyncHTTPTransport') as mock_transport:
+            await client.get_client()
+
+        assert mock_async_client.call_args.kwargs["transport"] is mock_transport.return_value
+        transport_kwargs = mock_transport.call_args.kwargs
+        assert transport_kwargs["http2"] is True
+        assert transport_kwargs["limits"] is DEFAULT_LIMITS
+        assert transport_kwargs["retries"] == 2
+        assert DEFAULT_LIMITS.max_keepalive_connections == 20
+        assert mock_async_client.call_args.kwargs["timeout"].connect == 5.0
+
     @pytest.mark.asyncio
     async def test_get_request(self):
         """Test GET request helper."""
@@ -139,12 +161,46 @@ class TestPlankaCache:
         assert result1["call"] == 1
 
         # Manually expire the cache
-        cache.workspace.timestamp = time.time() - 400  # 400 seconds ago (> 300 TTL)
+        cache.workspace.expiry_ts = time.monotonic() - 100  # expired 100 seconds ago
 
         # Second call - should fetch again
         result2 = await cache.get_workspace(fetch_func)
         assert result2["call"] == 2
 
+    @pytest.mark.asyncio
+    async def test_peek_workspace_never_fetches(self):
+        """Test that peek_workspace returns only a valid cached workspace."""
+        cache = PlankaCache()
+        assert cache.peek_workspace() is None
+
+        data = await cache.get_workspace(AsyncMock(return_value={"projects": []}))
+        assert cache.peek_workspace() is data
+
+        cache.workspace.expiry_ts = time.monotonic() - 1
+        assert cache.peek_workspace() is None
+
+    def test_card_board_id_from_card_or_board_cache(self):
+        """Test that a card's board is found in the card cache, else in the board overviews."""
+        cache = PlankaCache()
+        cache.put_board_overview("board2", {"included": {"cards": [{"id": "card2"}]}})
+        cache.card_details["card1"] = CacheEntry({"id": "card1", "boardId": "board1"}, time.monotonic() + 60)
+
+        assert cache.card_board_id("card1") == "board1"
+        assert cache.card_board_id("card2") == "board2"
+        assert cache.card_board_id("card3") is None
+
+    def test_invalidate_boards(self):
+        """Test that all board overviews and the search index are dropped."""
+        cache = PlankaCache()
+        cache.put_board_overview("board1", {"item": {}})
+        cache.put_board_overview("board2", {"item": {}})
+        cache.search_index = CacheEntry(data=[], expiry_ts=time.monotonic() + 60)
+
+        cache.invalidate_boards()
+
+        assert not cache.board_overviews
+        assert cache.search_index is None
+
     def test_cache_invalidation(self):
         """Test cache invalidation methods."""
         cache = PlankaCache()
@@ -155,7 +211,7 @@ class TestPlankaCache:
         assert cache.workspace is None
         
         # Test board invalidation
-        cache.board_overviews["board1"] = CacheEntry(data={"name": "Test Board"}, timestamp=time.time(), ttl=180)
+        cache.board_overviews["board1"] = CacheEntry(data={"name": "Test Board"}, expiry_ts=time.monotonic() + 180)
         cache.invalidate_board("board1")
         assert "board1" not in cache.board_overviews
         
@@ -196,6 +252,22 @@ class TestPlankaCache:
         assert cache.stats["board_overview_hits"] == 1
         assert cache.stats["board_overview_misses"] == 1
 
+    @pytest.mark.asyncio
+    async def test_board_overview_cache_evicts_least_recently_used(self):
+        """Test that board overviews are capped, evicting the least recently used board."""
+        cache = PlankaCache()
+        cache.max_board_cache_size = 2
+
+        async def fetch_func():
+            return {}
+
+        await cache.get_board_overview("board1", fetch_func)
+        await cache.get_board_overview("board2", fetch_func)
+        await cache.get_board_overview("board1", fetch_func)  # board2 is now oldest
+        await cache.get_board_overview("board3", fetch_func)
+
+        assert list(cache.board_overviews) == ["board1", "board3"]
+
     @pytest.mark.asyncio
     async def test_card_cache_miss(self):
         """Test card cache miss."""
@@ -246,12 +318,269 @@ class TestPlankaCache:
         assert result1["call"] == 1
         
         # Manually expire the cache
-        cache.card_details["card1"].timestamp = time.time() - 120  # 120 seconds ago (> 60 TTL)
+        cache.card_details["card1"].expiry_ts = time.monotonic() - 60  # expired 60 seconds ago
         
         # Second call - should fetch again
         result2 = await cache.get_card("card1", fetch_func)
         assert result2["call"] == 2
 
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self):
+        """Test that concurrent cache misses for the same key fetch only once."""
+        cache = PlankaCache()
+        call_count = 0
+
+        async def fetch_func():
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return {"projects": []}
+
+        results = await asyncio.gather(*(cache.get_workspace(fetch_func) for _ in range(5)))
+
+        assert call_count == 1
+        assert all(result == {"projects": []} for result in results)
+        assert cache._inflight == {}
+
+        # Different keys are fetched independently
+        await asyncio.gather(cache.get_card("card1", fetch_func), cache.get_card("card2", fetch_func))
+        assert call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_fetch_error(self):
+        """Test that a failed shared fetch raises for every waiter and is not cached."""
+        cache = PlankaCache()
+        call_count = 0
+
+        async def fetch_func():
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            raise httpx.ConnectError("down")
+
+        results = await asyncio.gather(
+            *(cache.get_board_overview("board1", fetch_func) for _ in range(3)),
+            return_exceptions=True
+        )
+
+        assert call_count == 1
+        assert all(isinstance(result, httpx.ConnectError) for result in results)
+        assert "board1" not in cache.board_overviews
+        assert cache._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_first_caller_does_not_cancel_other_waiters(self):
+        """Test that cancelling the caller that started a shared fetch leaves the others waiting."""
+        cache = PlankaCache()
+        release = asyncio.Event()
+
+        async def fetch_func():
+            await release.wait()
+            return {"projects": []}
+
+        first = asyncio.ensure_future(cache.get_workspace(fetch_func))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(cache.get_workspace(fetch_func))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await second == {"projects": []}
+        assert first.cancelled()
+        assert cache._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_workspace_json_serialized_once_per_entry(self):
+        """Test that workspace JSON is memoized on the cache entry."""
+        cache = PlankaCache()
+
+        async def fetch_func():
+            return {"projects": [{"id": "proj1"}]}
+
+        first = await cache.get_workspace_json(fetch_func)
+        assert json.loads(first) == {"projects": [{"id": "proj1"}]}
+        assert cache.workspace.serialized_json is first
+
+        with patch("planka_mcp.cache.json_dumps") as mock_dumps:
+            assert await cache.get_workspace_json(fetch_func) is first
+            mock_dumps.assert_not_called()
+
+        # A new entry after invalidation is serialized again
+        cache.invalidate_workspace()
+        assert await cache.get_workspace_json(fetch_func) == first
+        assert cache.stats["workspace_misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_workspace_markdown_rendered_once_per_entry(self):
+        """Test that rendered workspace Markdown is memoized on the cache entry."""
+        cache = PlankaCache()
+        render_func = Mock(side_effect=lambda data: f"# {len(data['projects'])} projects")
+
+        async def fetch_func():
+            return {"projects": [{"id": "proj1"}]}
+
+        assert await cache.get_workspace_markdown(fetch_func, render_func) == "# 1 projects"
+        assert await cache.get_workspace_markdown(fetch_func, render_func) == "# 1 projects"
+        render_func.assert_called_once()
+
+        # Refetching replaces the entry and with it the rendered Markdown
+        cache.invalidate_workspace()
+        await cache.get_workspace_markdown(fetch_func, render_func)
+        assert render_func.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_task_drops_its_card(self):
+        """Test that tasks on fetched cards map back to the card for invalidation."""
+        cache = PlankaCache()
+        card = {"id": "card1", "taskLists": [{"id": "tl1", "tasks": [{"id": "task1"}]}]}
+        await cache.get_card("card1", AsyncMock(return_value=card))
+
+        cache.invalidate_task("unknown_task")
+        assert "card1" in cache.card_details
+
+        cache.invalidate_task("task1")
+        assert "card1" not in cache.card_details
+
+    @pytest.mark.asyncio
+    async def test_board_index_built_once_per_entry(self):
+        """Test that indexes derived from a cached board are memoized on its entry."""
+        cache = PlankaCache()
+        board = {"included": {"cards": []}}
+        build_func = Mock(return_value={"label1": {"card1"}})
+
+        data = await cache.get_board_overview("board1", AsyncMock(return_value=board))
+        first = cache.get_board_index("board1", data, "label_cards", build_func)
+        assert cache.get_board_index("board1", data, "label_cards", build_func) is first
+        build_func.assert_called_once_with(board)
+
+        # Data that is no longer cached gets a fresh, unkept index
+        cache.invalidate_board("board1")
+        cache.get_board_index("board1", data, "label_cards", build_func)
+        assert build_func.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_patch_board_card_updates_cached_board(self):
+        """Test that card writes are applied to a cached board without refetching it."""
+        cache = PlankaCache()
+        board = {"included": {"cards": [{"id": "card1", "name": "Old"}, {"id": "card2", "name": "Two"}]}}
+        fetch_func = AsyncMock(return_value=board)
+        data = await cache.get_board_overview("board1", fetch_func)
+        cache.get_board_index("board1", data, "label_cards", Mock(return_value={}))
+
+        cache.patch_board_card("board1", {"id": "card1", "name": "New"})
+        cache.patch_board_card("board1", {"id": "card3", "name": "Three"})
+        # Boards that are not cached are left alone
+        cache.patch_board_card("board2", {"id": "card4"})
+
+        data = await cache.get_board_overview("board1", fetch_func)
+        assert [c["name"] for c in data["included"]["cards"]] == ["New", "Two", "Three"]
+        assert fetch_func.call_count == 1
+        assert cache.board_overviews["board1"].indexes is None
+        assert "board2" not in cache.board_overviews
+
+    @pytest.mark.asyncio
+    async def test_patch_card_merges_fields(self):
+        """Test that updated fields are merged into a cached card."""
+        cache = PlankaCache()
+        fetch_func = AsyncMock(return_value={"id": "card1", "name": "Old", "taskLists": []})
+        await cache.get_card_json("card1", fetch_func)
+
+        cache.patch_card("card1", {"id": "card1", "name": "New"})
+
+        assert json.loads(await cache.get_card_json("card1", fetch_func)) == {
+            "id": "card1", "name": "New", "taskLists": []
+        }
+        assert fetch_func.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_card_json_serialized_once_per_entry(self):
+        """Test that card JSON is memoized on the card cache entry."""
+        cache = PlankaCache()
+        fetch_func = AsyncMock(return_value={"id": "card1", "name": "Card"})
+
+        first = await cache.get_card_json("card1", fetch_func)
+        assert json.loads(first) == {"id": "card1", "name": "Card"}
+        assert await cache.get_card_json("card1", fetch_func) is first
+        assert fetch_func.call_count == 1
+
+        cache.invalidate_card("card1")
+        assert await cache.get_card_json("card1", fetch_func) is not first
+        assert fetch_func.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_index_cached_and_dropped_on_invalidation(self):
+        """Test that the search index is reused until a board or card changes."""
+        cache = PlankaCache()
+        fetch_func = AsyncMock(return_value={"entries": [], "complete": True})
+
+        await cache.get_search_index(fetch_func)
+        await cache.get_search_index(fetch_func)
+        assert fetch_func.call_count == 1
+        assert cache.stats["search_index_hits"] == 1
+
+        cache.invalidate_card("card1")
+        await cache.get_search_index(fetch_func)
+        cache.invalidate_board("board1")
+        await cache.get_search_index(fetch_func)
+        assert fetch_func.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_refresh_workspace_replaces_valid_entry(self):
+        """Test that refreshing re-fetches even while the cached workspace is valid."""
+        cache = PlankaCache()
+        cache.workspace = CacheEntry({"projects": []}, time.monotonic() + 300)
+
+        async def fetch_func():
+            return {"projects": [{"id": "proj1"}]}
+
+        result = await cache.refresh_workspace(fetch_func)
+
+        assert result == {"projects": [{"id": "proj1"}]}
+        assert cache.workspace.data is result
+        assert await cache.get_workspace(fetch_func) is result
+
+    def test_cache_cleanup_prefers_evicting_unused_cards(self):
+        """Test that eviction picks the least hit card among the least recently used."""
+        cache = PlankaCache()
+        for i in range(110):
+            cache.card_details[f"card{i}"] = CacheEntry({"id": f"card{i}"}, time.monotonic() + 60)
+        # card0 is the least recently used but has been read often
+        cache.card_details["card0"].hits = 5
+
+        cache.cleanup_card_cache()
+
+        assert len(cache.card_details) == 50
+        assert "card0" in cache.card_details
+        assert "card1" not in cache.card_details
+
+    def test_cache_cleanup_removes_expired_cards(self):
+        """Test that expired cards are dropped via the expiry heap."""
+        cache = PlankaCache()
+        cache.card_details["old"] = CacheEntry({"id": "old"}, time.monotonic() - 60)
+        cache._card_expiry.append((cache.card_details["old"].expiry_ts, "old"))
+
+        cache.cleanup_card_cache()
+
+        assert "old" not in cache.card_details
+        assert cache._card_expiry == []
+
+    @pytest.mark.asyncio
+    async def test_card_cache_hit_updates_recency(self):
+        """Test that a cache hit marks the card most recently used."""
+        cache = PlankaCache()
+
+        async def fetch_func():
+            return {"id": "card"}
+
+        await cache.get_card("card1", fetch_func)
+        await cache.get_card("card2", fetch_func)
+        await cache.get_card("card1", fetch_func)
+
+        assert list(cache.card_details) == ["card2", "card1"]
+        assert cache.card_details["card1"].hits == 1
+
 class TestPaginationHelper:
     """Test PaginationHelper functionality."""
     
@@ -280,9 +609,9 @@ class TestPaginationHelper:
         }
 
         # Set up cache entries
-        cache.workspace = CacheEntry({"test": "data"}, time.time(), 300)
-        cache.board_overviews["board1"] = CacheEntry({"board": "data"}, time.time(), 180)
-        cache.card_details["card1"] = CacheEntry({"card": "data"}, time.time(), 60)
+        cache.workspace = CacheEntry({"test": "data"}, time.monotonic() + 300)
+        cache.board_overviews["board1"] = CacheEntry({"board": "data"}, time.monotonic() + 180)
+        cache.card_details["card1"] = CacheEntry({"card": "data"}, time.monotonic() + 60)
 
         # Test invalidation
         cache.invalidate_workspace()
@@ -302,8 +631,7 @@ class TestPaginationHelper:
         for i in range(110):
             cache.card_details[f"card{i}"] = CacheEntry(
                 {"id": f"card{i}"},
-                time.time() - i,  # Older cards have earlier timestamps
-                60
+                time.monotonic() + 60 - i  # Older cards expire earlier
             )
 
         cache.cleanup_card_cache()
@@ -311,20 +639,25 @@ class TestPaginationHelper:
         # Should keep only 50 most recent
         assert len(cache.card_details) == 50
 
-
 class TestCacheEntry:
     """Test CacheEntry functionality."""
 
     def test_cache_entry_is_valid(self):
         """Test cache entry validity check."""
-        entry = CacheEntry({"test": "data"}, time.time(), 300)
+        entry = CacheEntry({"test": "data"}, time.monotonic() + 300)
 
         assert entry.is_valid() is True
 
         # Expired entry
-        old_entry = CacheEntry({"test": "data"}, time.time() - 400, 300)
+        old_entry = CacheEntry({"test": "data"}, time.monotonic() - 100)
         assert old_entry.is_valid() is False
 
+    def test_cache_entry_has_no_instance_dict(self):
+        """Test that cache entries are slotted to keep many cached cards small."""
+        entry = CacheEntry({"test": "data"}, time.monotonic() + 60)
+
+        assert not hasattr(entry, "__dict__")
+
 
 class TestResponseFormatter:
     """Test ResponseFormatter functionality."""
@@ -344,6 +677,18 @@ class TestResponseFormatter:
         assert len(result) < 25000
         assert "RESPONSE TRUNCATED" in result
 
+    def test_truncate_response_cuts_at_late_newline(self):
+        """Test that truncation prefers a newline near the cut point and ignores early ones."""
+        # limit=1000 keeps 600 chars; newlines at 100 (too early) and 550 (in window)
+        content = "A" * 100 + "\n" + "B" * 449 + "\n" + "C" * 2000
+        result = ResponseFormatter.truncate_response(content, limit=1000)
+        assert result.startswith(content[:550] + "\n---")
+
+        # Only an early newline: cut at the fixed position instead
+        content = "A" * 100 + "\n" + "B" * 2000
+        result = ResponseFormatter.truncate_response(content, limit=1000)
+        assert result.startswith(content[:600] + "\n---")
+
     def test_format_task_progress_no_tasks(self):
         """Test task progress formatting with no tasks."""
         result = ResponseFormatter.format_task_progress([])
@@ -413,6 +758,30 @@ class TestResponseFormatter:
         assert "## Comments" in result
         assert "Test comment" in result
 
+    def test_format_card_list_resolves_names_once(self):
+        """Test that the card list builds the flat name maps once for all cards."""
+        context = {
+            'lists': {'list1': {'name': 'To Do'}, 'list2': {}},
+            'labels': {'label1': {'name': 'Bug'}},
+            'users': {},
+            'card_labels': {'card1': ['label1', 'missing']},
+        }
+        cards = [
+            {'id': 'card1', 'name': 'First', 'listId': 'list1'},
+            {'id': 'card2', 'name': 'Second', 'listId': 'list2'},
+        ]
+
+        with patch.object(FormatCtx, 'from_context', wraps=FormatCtx.from_context) as mock_from_context:
+            result = ResponseFormatter.format_card_list_markdown(cards, context, DetailLevel.PREVIEW)
+
+        mock_from_context.assert_called_once_with(context)
+        # Slotted: no per-instance __dict__
+        assert not hasattr(FormatCtx.from_context(context), "__dict__")
+        assert "List: To Do" in result
+        assert "Labels: Bug, " in result
+        # Lists without a name fall back to the placeholder
+        assert "List: Unknown List" in result
+
 
 class TestPaginationHelper:
     """Test PaginationHelper functionality."""
@@ -477,6 +846,93 @@ class TestPaginationHelper:
             "next_offset": None
         }
 
+    @pytest.mark.parametrize("offset,limit", [(0, 10), (20, 10), (95, 10), (150, 10), (0, 200)])
+    def test_paginate_iter_matches_paginate_results(self, offset, limit):
+        """Test that lazy pagination gives the same page and metadata as list pagination."""
+        items = [{"id": f"item{i}"} for i in range(100)]
+
+        result = PaginationHelper.paginate_iter(iter(items), offset, limit)
+
+        assert result == PaginationHelper.paginate_results(items, offset, limit)
+
+
+class TestJsonHelpers:
+    """Test JSON serialization helpers."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_round_trip(self, use_orjson):
+        """Test that both the orjson and stdlib paths round-trip and indent."""
+        import planka_mcp.utils as utils_module
+
+        data = {"card": {"id": "card1", "labels": ["Bug"], "position": 1.5}, 1: None}
+        orjson_module = utils_module.orjson if use_orjson else None
+        if use_orjson and orjson_module is None:
+            pytest.skip("orjson not installed")
+
+        with patch.object(utils_module, "orjson", orjson_module):
+            content = json_dumps(data)
+            assert '\n  "card": {' in content
+            assert json_loads(content) == {"card": data["card"], "1": None}
+            assert json_loads(content.encode()) == json_loads(content)
+
+
+
+class TestBuildCardLabelsMap:
+    """Test grouping of the cardLabels join table."""
+
+    def test_groups_label_ids_by_card(self):
+        """Test that label IDs are grouped per card and incomplete rows are skipped."""
+        card_labels = [
+            {"id": "cl1", "cardId": "card1", "labelId": "label1"},
+            {"id": "cl2", "cardId": "card2", "labelId": "label1"},
+            {"id": "cl3", "cardId": "card1", "labelId": "label2"},
+            {"id": "cl4", "cardId": "card3"},
+        ]
+
+        result = build_card_labels_map(card_labels)
+
+        assert result == {"card1": ["label1", "label2"], "card2": ["label1"]}
+        assert type(result) is dict
+
+    def test_label_cards_map_inverts_join_table(self):
+        """Test that card IDs are grouped per label."""
+        card_labels = [
+            {"cardId": "card1", "labelId": "label1"},
+            {"cardId": "card2", "labelId": "label1"},
+            {"cardId": "card1", "labelId": "label2"},
+            {"labelId": "label3"},
+        ]
+
+        assert build_label_cards_map(card_labels) == {
+            "label1": {"card1", "card2"},
+            "label2": {"card1"},
+        }
+
+
+class TestBuildContext:
+    """Test formatting context construction."""
+
+    def test_included_data_takes_precedence(self, sample_workspace_data):
+        """Test that included lists, labels, users and cardLabels override the workspace."""
+        included = {
+            "labels": [{"id": "label9", "name": "Urgent"}],
+            "cardLabels": [{"cardId": "card1", "labelId": "label9"}],
+        }
+
+        context = build_context(sample_workspace_data, included, board_id="board1")
+
+        assert context["labels"] == {"label9": {"id": "label9", "name": "Urgent"}}
+        assert context["card_labels"] == {"card1": ["label9"]}
+        # Missing keys fall back to the workspace maps themselves, not copies
+        assert context["users"] is sample_workspace_data["users"]
+        assert context["lists"] is sample_workspace_data["lists"]
+        assert context["board_name"] == "Test Board"
+
+    def test_board_name_override_and_unknown_board(self):
+        """Test the explicit board name and the unknown board fallback."""
+        assert build_context({}, board_name="Ops")["board_name"] == "Ops"
+        assert build_context({}, board_id="missing")["board_name"] == "Unknown Board"
+
 
 class TestErrorHandling:
     """Test error handling functionality."""
@@ -529,6 +985,19 @@ class TestErrorHandling:
         assert "Cannot connect" in result
         assert "PLANKA_BASE_URL" in result
 
+    def test_handle_api_error_subclasses(self):
+        """Test that specific httpx errors get the message of their base error type."""
+        assert "timed out" in handle_api_error(httpx.ReadTimeout("Read timed out"))
+        assert "timed out" in handle_api_error(httpx.ConnectTimeout("Connect timed out"))
+
+    def test_handle_api_error_other_status(self):
+        """Test that unmapped HTTP statuses report the status code."""
+        response = Mock()
+        response.status_code = 502
+        error = httpx.HTTPStatusError("Bad Gateway", request=Mock(), response=response)
+
+        assert handle_api_error(error) == "Error: API request failed (HTTP 502). Please try again."
+
     def test_handle_api_error_generic(self):
         """Test generic error handling."""
         error = Exception("Something went wrong")
@@ -0,0 +1,126 @@
+"""Tests for the stdio MCP server entry point."""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from planka_mcp import instances
+from planka_mcp import mcp_server
+from planka_mcp.api_client import PlankaAPIClient
+from planka_mcp.cache import PlankaCache
+
+
+class TestInitializeServer:
+    """Test server initialization and cleanup."""
+
+    @pytest.mark.asyncio
+    async def test_initialize_server_sets_instances(self, monkeypatch):
+        """Test that initialization injects the client and cache into instances."""
+        monkeypatch.setenv("PLANKA_BASE_URL", "https://test.planka.com")
+        with patch("planka_mcp.api_client.initialize_auth", AsyncMock(return_value="test-token")), \
+             patch("planka_mcp.instances.api_client", None), \
+             patch("planka_mcp.instances.cache", None):
+            await mcp_server.initialize_server()
+
+            assert isinstance(instances.api_client, PlankaAPIClient)
+            assert instances.api_client.auth_token == "test-token"
+            assert isinstance(instances.cache, PlankaCache)
+
+    @pytest.mark.asyncio
+    async def test_initialize_server_reports_startup(self, monkeypatch, capsys):
+        """Test that the startup banner is written to stderr, not stdout."""
+        monkeypatch.setenv("PLANKA_BASE_URL", "https://test.planka.com")
+        with patch("planka_mcp.api_client.initialize_auth", AsyncMock(return_value="test-token")), \
+             patch("planka_mcp.instances.api_client", None), \
+             patch("planka_mcp.instances.cache", None):
+            await mcp_server.initialize_server()
+
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert "Planka MCP Server initialized successfully\n" in captured.err
+        assert "Connected to: https://test.planka.com\n" in captured.err
+        assert "Waiting for MCP protocol messages...\n" in captured.err
+
+    @pytest.mark.asyncio
+    async def test_initialize_server_auth_failure(self, monkeypatch):
+        """Test that authentication errors are propagated."""
+        monkeypatch.setenv("PLANKA_BASE_URL", "https://test.planka.com")
+        with patch("planka_mcp.api_client.initialize_auth", AsyncMock(side_effect=ValueError("no auth"))):
+            with pytest.raises(ValueError, match="no auth"):
+                await mcp_server.initialize_server()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_server_closes_client(self):
+        """Test that cleanup closes the API client."""
+        client = AsyncMock()
+        with patch("planka_mcp.instances.api_client", client):
+            await mcp_server.cleanup_server()
+        client.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_main_runs_stdio_and_cleans_up(self):
+        """Test that main initializes, serves over stdio and always cleans up."""
+        with patch("planka_mcp.mcp_server.initialize_server", AsyncMock()) as mock_init, \
+             patch("planka_mcp.mcp_server.cleanup_server", AsyncMock()) as mock_cleanup, \
+             patch("planka_mcp.mcp_server.keep_workspace_warm", AsyncMock()), \
+             patch.object(mcp_server.mcp, "run_stdio_async", AsyncMock(side_effect=RuntimeError("boom"))):
+            with pytest.raises(RuntimeError, match="boom"):
+                await mcp_server.main()
+
+        mock_init.assert_called_once()
+        mock_cleanup.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_main_starts_and_cancels_workspace_warmup(self):
+        """Test that main warms the workspace cache in the background and stops it on exit."""
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def fake_warm():
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def fake_run():
+            await started.wait()
+
+        with patch("planka_mcp.mcp_server.initialize_server", AsyncMock()), \
+             patch("planka_mcp.mcp_server.cleanup_server", AsyncMock()), \
+             patch("planka_mcp.mcp_server.keep_workspace_warm", fake_warm), \
+             patch.object(mcp_server.mcp, "run_stdio_async", fake_run):
+            await mcp_server.main()
+            await asyncio.sleep(0)
+
+        assert started.is_set()
+        assert cancelled.is_set()
+
+
+class TestToolRegistration:
+    """Test that handlers are registered as MCP tools."""
+
+    @pytest.mark.asyncio
+    async def test_all_tools_registered(self):
+        """Test that every entry in TOOLS is exposed by the MCP server."""
+        tools = {tool.name: tool for tool in await mcp_server.mcp.list_tools()}
+
+        assert set(tools) == {name for name, _, _ in mcp_server.TOOLS}
+        for name, _, description in mcp_server.TOOLS:
+            assert tools[name].description == description
+            assert "params" in tools[name].inputSchema["properties"]
+
+
+class TestEventLoopRunner:
+    """Test event loop selection for the console script."""
+
+    def test_falls_back_to_asyncio_run(self):
+        """Test that asyncio.run is used when uvloop/winloop are not installed."""
+        with patch.dict("sys.modules", {"uvloop": None, "winloop": None}):
+            assert mcp_server._event_loop_runner() is asyncio.run
+
+    def test_prefers_uvloop_when_installed(self):
+        """Test that the fast loop's run() is used when available."""
+        fake_loop = Mock()
+        with patch.dict("sys.modules", {"uvloop": fake_loop, "winloop": fake_loop}):
+            assert mcp_server._event_loop_runner() is fake_loop.run
@@ -109,6 +109,13 @@ class TestListCardsInput:
         with pytest.raises(ValidationError):
             ListCardsInput(board_id="board123", extra_field="not allowed")
 
+    def test_inputs_are_immutable(self):
+        """Test that validated inputs cannot be modified after construction."""
+        input_data = ListCardsInput(board_id="board123")
+
+        with pytest.raises(ValidationError):
+            input_data.limit = 10
+
 
 class TestGetCardInput:
     """Test GetCardInput model."""
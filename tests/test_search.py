@@ -1,4 +1,6 @@
 """Tests for the search handler."""
+import asyncio
+import httpx
 import pytest
 from unittest.mock import patch, Mock
 
@@ -22,14 +24,80 @@ class TestPlankaFindAndGetCard:
              patch("planka_mcp.instances.cache", mock_cache):
 
             mock_cache.get_workspace.return_value = sample_workspace_data
-            board_response = {"included": {"cards": [sample_card_data]}}
+            board_response = {
+                "item": {"id": "board1", "name": "Test Board"},
+                "included": {
+                    "cards": [sample_card_data],
+                    "lists": list(sample_workspace_data["lists"].values()),
+                    "labels": list(sample_workspace_data["labels"].values()),
+                    "cardLabels": [{"id": "cl1", "cardId": "card1", "labelId": "label1"}],
+                },
+            }
             card_detail_response = {"item": sample_card_data, "included": {}}
             mock_planka_api_client.get.side_effect = [board_response, card_detail_response]
 
+            async def get_card(card_id, fetch_func):
+                return await fetch_func()
+
+            mock_cache.get_card.side_effect = get_card
+
             params = FindAndGetCardInput(query="Test Card", board_id="board1")
             result = await planka_find_and_get_card(params)
             assert "Test Card" in result
             assert "card1" in result
+            # The full card is read through the card cache
+            assert mock_cache.get_card.call_args.args[0] == "card1"
+            mock_planka_api_client.get.assert_called_with("cards/card1")
+            # Labels not included with the card come from the board overview
+            assert "Bug" in result
+            assert "Test Board" in result
+            # A board-scoped search never downloads the whole workspace
+            mock_cache.get_workspace.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_find_single_card_served_from_card_cache(
+        self,
+        mock_planka_api_client,
+        mock_cache,
+        sample_workspace_data,
+        sample_card_data,
+    ):
+        """Test that a cached card is returned without requesting it again."""
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
+             patch("planka_mcp.instances.cache", mock_cache):
+            mock_cache.get_workspace.return_value = sample_workspace_data
+            mock_cache.get_card.return_value = dict(sample_card_data, _included_labels=[])
+            mock_planka_api_client.get.return_value = {"included": {"cards": [sample_card_data]}}
+
+            params = FindAndGetCardInput(query="Test Card", board_id="board1", response_format="json")
+            result = await planka_find_and_get_card(params)
+
+        mock_planka_api_client.get.assert_called_once_with("boards/board1")
+        assert mock_cache.get_board_overview.call_args.args[0] == "board1"
+        assert '"id": "card1"' in result
+        assert "_included_labels" not in result
+
+    @pytest.mark.asyncio
+    async def test_find_single_card_without_full_fetch(
+        self,
+        mock_planka_api_client,
+        mock_cache,
+        sample_workspace_data,
+        sample_card_data,
+    ):
+        """Test that fetch_full=False renders the matched card without fetching it."""
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
+             patch("planka_mcp.instances.cache", mock_cache):
+            mock_cache.get_workspace.return_value = sample_workspace_data
+            mock_planka_api_client.get.return_value = {"included": {"cards": [sample_card_data]}}
+
+            params = FindAndGetCardInput(query="Test Card", board_id="board1", fetch_full=False)
+            result = await planka_find_and_get_card(params)
+
+        mock_planka_api_client.get.assert_called_once_with("boards/board1")
+        mock_cache.get_card.assert_not_called()
+        assert "Test Card" in result
+        assert "card1" in result
 
     @pytest.mark.asyncio
     async def test_find_multiple_cards(
@@ -115,3 +183,121 @@ class TestPlankaFindAndGetCard:
             assert "Test Card 1" in result
             assert "Another Test Card" in result
             assert "Use planka_get_card with a specific card ID" in result
+
+    @pytest.mark.asyncio
+    async def test_find_across_boards_fetches_concurrently(
+        self, mock_planka_api_client, mock_cache, sample_workspace_data, capsys
+    ):
+        """Test that boards are searched concurrently and a failing board is skipped."""
+        workspace = dict(sample_workspace_data, boards={
+            "board1": {"id": "board1", "name": "One"},
+            "board2": {"id": "board2", "name": "Two"},
+            "board3": {"id": "board3", "name": "Three"},
+        })
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get(endpoint, params=None):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if endpoint == "boards/board2":
+                raise httpx.ConnectError("unreachable")
+            board_id = endpoint.split("/")[1]
+            return {"included": {"cards": [
+                {"id": f"{board_id}-card", "name": "Match", "boardId": board_id, "listId": "list1"}
+            ]}}
+
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
+             patch("planka_mcp.instances.cache", mock_cache):
+            mock_cache.get_workspace.return_value = workspace
+            mock_planka_api_client.get.side_effect = get
+
+            result = await planka_find_and_get_card(FindAndGetCardInput(query="match"))
+
+        assert max_in_flight == 3
+        assert "Found 2 matching cards" in result
+        assert "board1-card" in result and "board3-card" in result
+        # An index missing a board is not kept for later searches
+        mock_cache.invalidate_search_index.assert_called_once()
+        assert "Search skipped board board2: unreachable" in capsys.readouterr().err
+        # The boards to index come from the workspace the search already loaded
+        mock_cache.get_workspace.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_find_across_boards_all_failing(
+        self, mock_planka_api_client, mock_cache, sample_workspace_data
+    ):
+        """Test that an error is reported when no board could be searched."""
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
+             patch("planka_mcp.instances.cache", mock_cache):
+            mock_cache.get_workspace.return_value = sample_workspace_data
+            mock_planka_api_client.get.side_effect = httpx.ConnectError("unreachable")
+
+            result = await planka_find_and_get_card(FindAndGetCardInput(query="test"))
+
+        assert "Cannot connect to Planka server" in result
+
+    @pytest.mark.asyncio
+    async def test_find_across_boards_uses_search_index(
+        self, mock_planka_api_client, mock_cache, sample_workspace_data
+    ):
+        """Test that a cached search index answers without fetching any board."""
+        card = {"id": "card1", "name": "Login Bug", "boardId": "board1", "listId": "list1"}
+        other = {"id": "card2", "name": "Docs", "description": "Mentions login", "boardId": "board1"}
+        index = {"entries": [
+            ("login bug\0", card),
+            ("docs\0mentions login", other),
+        ], "complete": True}
+
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
+             patch("planka_mcp.instances.cache", mock_cache):
+            mock_cache.get_workspace.return_value = sample_workspace_data
+            mock_cache.get_search_index.side_effect = None
+            mock_cache.get_search_index.return_value = index
+
+            result = await planka_find_and_get_card(FindAndGetCardInput(query="LOGIN"))
+
+        mock_planka_api_client.get.assert_not_called()
+        mock_cache.invalidate_search_index.assert_not_called()
+        assert "Found 2 matching cards" in result
+        assert "Login Bug" in result and "Docs" in result
+
+    @pytest.mark.asyncio
+    async def test_search_does_not_match_across_name_and_description(
+        self, mock_planka_api_client, mock_cache, sample_workspace_data
+    ):
+        """Test that a query spanning the end of the name and start of the description does not match."""
+        board_response = {"included": {"cards": [{"id": "card1", "name": "abc", "description": "def"}]}}
+
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
+             patch("planka_mcp.instances.cache", mock_cache):
+            mock_cache.get_workspace.return_value = sample_workspace_data
+            mock_planka_api_client.get.return_value = board_response
+
+            result = await planka_find_and_get_card(FindAndGetCardInput(query="cd"))
+
+        assert "No cards found" in result
+
+    @pytest.mark.asyncio
+    async def test_search_is_caseless(
+        self, mock_planka_api_client, mock_cache, sample_workspace_data
+    ):
+        """Test that matching uses full case folding, not just lowercasing."""
+        board_response = {"included": {"cards": [
+            {"id": "card1", "name": "Straße sanieren", "boardId": "board1", "listId": "list1"},
+            {"id": "card2", "name": "Other", "boardId": "board1", "listId": "list1"},
+        ]}}
+
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
+             patch("planka_mcp.instances.cache", mock_cache):
+            mock_cache.get_workspace.return_value = sample_workspace_data
+            mock_planka_api_client.get.return_value = board_response
+
+            result = await planka_find_and_get_card(
+                FindAndGetCardInput(query="STRASSE", fetch_full=False)
+            )
+
+        assert "Straße sanieren" in result
@@ -1,4 +1,6 @@
 """Tests for the tasks and labels handler."""
+import asyncio
+import httpx
 import pytest
 from unittest.mock import patch, Mock, call
 
@@ -6,6 +8,7 @@ from planka_mcp.models import (
     AddTaskInput,
     UpdateTaskInput,
     AddCardLabelInput,
+    AddCardLabelsBulkInput,
     RemoveCardLabelInput,
     DeleteTaskInput,
 )
@@ -13,6 +16,7 @@ from planka_mcp.handlers.tasks_labels import (
     planka_add_task,
     planka_update_task,
     planka_add_card_label,
+    planka_add_card_labels_bulk,
     planka_remove_card_label,
     planka_delete_task,
 )
@@ -50,6 +54,7 @@ class TestPlankaAddTask:
                 "cards/card1/tasks",
                 {"name": "New Test Task", "position": 65535}
             )
+            mock_cache.remember_task.assert_called_once_with("new_task", "card1")
 
     @pytest.mark.asyncio
     async def test_add_task_simple_case(
@@ -113,6 +118,24 @@ class TestPlankaUpdateTask:
             result = await planka_update_task(params)
             assert "Marked task as complete" in result
             mock_planka_api_client.patch.assert_called_once()
+            mock_cache.invalidate_task.assert_called_once_with("task1")
+
+    @pytest.mark.asyncio
+    async def test_update_task_invalidates_card_from_response(
+        self,
+        mock_planka_api_client,
+        mock_cache
+    ):
+        """Test that the card named by the updated task is invalidated directly."""
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
+             patch("planka_mcp.instances.cache", mock_cache):
+            mock_planka_api_client.patch.return_value = {
+                "item": {"id": "task1", "name": "Test Task", "cardId": "card1"}
+            }
+            await planka_update_task(UpdateTaskInput(task_id="task1", is_completed=True))
+
+        mock_cache.invalidate_card.assert_called_once_with("card1")
+        mock_cache.invalidate_task.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_task_not_initialized(self):
@@ -138,9 +161,8 @@ class TestPlankaDeleteTask:
         with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
              patch("planka_mcp.instances.cache", mock_cache):
             # Mock the API calls
-            task_detail = {"item": {"id": "task1", "name": "Test Task"}}
-            mock_planka_api_client.get.return_value = task_detail
-            mock_planka_api_client.delete.return_value = None
+            deleted = {"item": {"id": "task1", "name": "Test Task", "cardId": "card1"}}
+            mock_planka_api_client.delete.return_value = deleted
             
             params = DeleteTaskInput(task_id="task1")
             result = await planka_delete_task(params)
@@ -149,8 +171,38 @@ class TestPlankaDeleteTask:
             assert "Test Task" in result
             assert "task1" in result
             # Verify the correct endpoints were called
-            mock_planka_api_client.get.assert_called_once_with("tasks/task1")
+            mock_planka_api_client.get.assert_not_called()
             mock_planka_api_client.delete.assert_called_once_with("tasks/task1")
+            mock_cache.invalidate_card.assert_called_once_with("card1")
+
+    @pytest.mark.asyncio
+    async def test_delete_task_without_item_in_response(
+        self,
+        mock_planka_api_client,
+        mock_cache
+    ):
+        """Test that a delete response without the task falls back to its ID."""
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
+             patch("planka_mcp.instances.cache", mock_cache):
+            mock_planka_api_client.delete.return_value = {}
+
+            result = await planka_delete_task(DeleteTaskInput(task_id="task1"))
+
+        assert "Deleted task: **Task task1**" in result
+        mock_cache.invalidate_task.assert_called_once_with("task1")
+
+    @pytest.mark.asyncio
+    async def test_delete_task_failure_is_reported(self, mock_planka_api_client, mock_cache):
+        """Test that a failing delete is reported as an error."""
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
+             patch("planka_mcp.instances.cache", mock_cache):
+            mock_planka_api_client.delete.side_effect = httpx.HTTPStatusError(
+                "Forbidden", request=Mock(), response=Mock(status_code=403)
+            )
+
+            result = await planka_delete_task(DeleteTaskInput(task_id="task1"))
+
+        assert "don't have permission" in result
 
     @pytest.mark.asyncio
     async def test_delete_task_not_initialized(self):
@@ -176,12 +228,40 @@ class TestPlankaAddCardLabel:
         """Test successful card label addition."""
         with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
              patch("planka_mcp.instances.cache", mock_cache):
-            mock_cache.get_workspace.return_value = sample_workspace_data
+            mock_cache.peek_workspace.return_value = sample_workspace_data
             mock_planka_api_client.post.return_value = {"item": {"id": "cardLabel1"}}
             params = AddCardLabelInput(card_id="card1", label_id="label1")
             result = await planka_add_card_label(params)
-            assert "Added label" in result
+            assert "Added label **Bug**" in result
             mock_planka_api_client.post.assert_called_once()
+            mock_cache.get_workspace.assert_not_called()
+            # The board's cached cardLabels are stale now
+            mock_cache.invalidate_card.assert_called_once_with("card1")
+            mock_cache.invalidate_board.assert_called_once_with("board1")
+
+    @pytest.mark.asyncio
+    async def test_add_card_label_does_not_wait_for_workspace(
+        self,
+        mock_planka_api_client,
+        mock_cache
+    ):
+        """Test that a cold workspace cache is warmed in the background, not awaited."""
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
+             patch("planka_mcp.instances.cache", mock_cache), \
+             patch("planka_mcp.handlers.tasks_labels.warm_workspace_soon") as mock_warm:
+            mock_planka_api_client.post.return_value = {
+                "item": {"id": "cardLabel1", "labelId": "label1"},
+                "included": {"labels": [{"id": "label1", "name": "Bug"}]},
+            }
+            params = AddCardLabelInput(card_id="card1", label_id="label1")
+            result = await planka_add_card_label(params)
+
+        assert "Added label **Bug**" in result
+        mock_cache.get_workspace.assert_not_called()
+        mock_warm.assert_called_once()
+        # The label's board is unknown, so no board's cardLabels can be trusted
+        mock_cache.invalidate_card.assert_called_once_with("card1")
+        mock_cache.invalidate_boards.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_add_card_label_not_initialized(self):
@@ -202,6 +282,95 @@ class TestPlankaAddCardLabel:
             assert "API client or Cache not initialized" in result
 
 
+class TestPlankaAddCardLabelsBulk:
+    """Test planka_add_card_labels_bulk tool."""
+
+    @pytest.mark.asyncio
+    async def test_add_card_labels_bulk_reports_each_assignment(
+        self,
+        mock_planka_api_client,
+        mock_cache,
+        sample_workspace_data
+    ):
+        """Test that every assignment is sent and a failure does not stop the others."""
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
+             patch("planka_mcp.instances.cache", mock_cache):
+            mock_cache.get_workspace.return_value = sample_workspace_data
+            mock_planka_api_client.post.side_effect = [
+                {"item": {"id": "cardLabel1"}},
+                httpx.HTTPStatusError("Not Found", request=Mock(), response=Mock(status_code=404)),
+            ]
+            params = AddCardLabelsBulkInput(assignments=[
+                AddCardLabelInput(card_id="card1", label_id="label1"),
+                AddCardLabelInput(card_id="card2", label_id="label1"),
+            ])
+            result = await planka_add_card_labels_bulk(params)
+
+        assert "Added 1 of 2 labels" in result
+        assert "✓ Added **Bug** to card `card1`" in result
+        assert "✗ **Bug** on card `card2`" in result
+        mock_cache.get_workspace.assert_awaited_once()
+        mock_planka_api_client.post.assert_has_calls([
+            call("cards/card1/labels", {"labelId": "label1"}),
+            call("cards/card2/labels", {"labelId": "label1"}),
+        ])
+        mock_cache.invalidate_card.assert_called_once_with("card1")
+        mock_cache.invalidate_board.assert_called_once_with("board1")
+
+    @pytest.mark.asyncio
+    async def test_add_card_labels_bulk_unknown_label_invalidates_all_boards(
+        self,
+        mock_planka_api_client,
+        mock_cache,
+        sample_workspace_data
+    ):
+        """Test that a label missing from the cached workspace drops every board overview."""
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
+             patch("planka_mcp.instances.cache", mock_cache):
+            mock_cache.get_workspace.return_value = sample_workspace_data
+            mock_planka_api_client.post.return_value = {"item": {"id": "cardLabel1"}}
+            params = AddCardLabelsBulkInput(assignments=[
+                AddCardLabelInput(card_id="card1", label_id="newLabel"),
+            ])
+            result = await planka_add_card_labels_bulk(params)
+
+        assert "Added 1 of 1 labels" in result
+        mock_cache.invalidate_card.assert_called_once_with("card1")
+        mock_cache.invalidate_board.assert_not_called()
+        mock_cache.invalidate_boards.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_add_card_labels_bulk_cancelled_request_is_not_counted(
+        self,
+        mock_planka_api_client,
+        mock_cache,
+        sample_workspace_data
+    ):
+        """Test that a cancelled POST is reported as failed, not as added."""
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
+             patch("planka_mcp.instances.cache", mock_cache):
+            mock_cache.get_workspace.return_value = sample_workspace_data
+            mock_planka_api_client.post.side_effect = asyncio.CancelledError()
+            params = AddCardLabelsBulkInput(assignments=[
+                AddCardLabelInput(card_id="card1", label_id="label1"),
+            ])
+            result = await planka_add_card_labels_bulk(params)
+
+        assert "Added 0 of 1 labels" in result
+        assert "✗ **Bug** on card `card1`" in result
+        mock_cache.invalidate_card.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_add_card_labels_bulk_not_initialized(self):
+        """Test add_card_labels_bulk when API client is not initialized."""
+        with patch("planka_mcp.instances.api_client", None):
+            params = AddCardLabelsBulkInput(assignments=[
+                AddCardLabelInput(card_id="card1", label_id="label1"),
+            ])
+            result = await planka_add_card_labels_bulk(params)
+            assert "API client or Cache not initialized" in result
+
+
 class TestPlankaRemoveCardLabel:
     """Test planka_remove_card_label tool."""
 
@@ -215,12 +384,14 @@ class TestPlankaRemoveCardLabel:
         """Test successful card label removal."""
         with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
              patch("planka_mcp.instances.cache", mock_cache):
-            mock_cache.get_workspace.return_value = sample_workspace_data
+            mock_cache.peek_workspace.return_value = sample_workspace_data
             mock_planka_api_client.delete.return_value = None
             params = RemoveCardLabelInput(card_id="card1", label_id="label1")
             result = await planka_remove_card_label(params)
             assert "Removed label" in result
             mock_planka_api_client.delete.assert_called_once()
+            mock_cache.invalidate_card.assert_called_once_with("card1")
+            mock_cache.invalidate_board.assert_called_once_with("board1")
 
     @pytest.mark.asyncio
     async def test_remove_card_label_not_initialized(self):
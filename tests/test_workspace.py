@@ -1,11 +1,13 @@
 """Tests for the workspace handler."""
+import asyncio
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 import json
 import httpx
 
+from planka_mcp.cache import PlankaCache
 from planka_mcp.models import GetWorkspaceInput, ResponseFormat
-from planka_mcp.handlers.workspace import planka_get_workspace, fetch_workspace_data
+from planka_mcp.handlers.workspace import planka_get_workspace, fetch_workspace_data, keep_workspace_warm, warm_workspace_soon
 
 
 class TestPlankaGetWorkspace:
@@ -109,6 +111,171 @@ class TestFetchWorkspaceData:
             assert "label1" in data["labels"]
             assert data["labels"]["label1"]["name"] == "Bug"
 
+    @pytest.mark.asyncio
+    async def test_fetch_workspace_data_multiple_projects(self, mock_planka_api_client):
+        """Test that boards from several projects are fetched and attributed correctly."""
+        responses = {
+            "projects": {"items": [{"id": "proj1", "name": "Alpha"}, {"id": "proj2", "name": "Beta"}]},
+            "users": {"items": []},
+            "projects/proj1": {"included": {"boards": [{"id": "board1"}, {"id": "board2"}]}},
+            "projects/proj2": {"included": {"boards": [{"id": "board3"}]}},
+            "boards/board1": {"item": {"id": "board1", "name": "One"}, "included": {}},
+            "boards/board2": {"item": {"id": "board2", "name": "Two"}, "included": {}},
+            "boards/board3": {
+                "item": {"id": "board3", "name": "Three"},
+                "included": {"lists": [{"id": "list3", "name": "Doing"}]},
+            },
+        }
+
+        async def get(endpoint, params=None):
+            return responses[endpoint]
+
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client):
+            mock_planka_api_client.get.side_effect = get
+
+            data = await fetch_workspace_data()
+
+        assert list(data["boards"]) == ["board1", "board2", "board3"]
+        assert data["boards"]["board1"]["project_name"] == "Alpha"
+        assert data["boards"]["board2"]["project_name"] == "Alpha"
+        assert data["boards"]["board3"]["project_name"] == "Beta"
+        assert data["lists"]["list3"]["board_name"] == "Three"
+        assert mock_planka_api_client.get.call_count == len(responses)
+
+    @pytest.mark.asyncio
+    async def test_fetch_workspace_data_requests_projects_and_users_concurrently(self, mock_planka_api_client):
+        """Test that the projects and users requests are in flight at the same time."""
+        both_requested = asyncio.Event()
+        requested = set()
+
+        async def get(endpoint, params=None):
+            requested.add(endpoint)
+            if {"projects", "users"} <= requested:
+                both_requested.set()
+            await asyncio.wait_for(both_requested.wait(), timeout=1)
+            return {"items": [], "included": {"boards": []}}
+
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client):
+            mock_planka_api_client.get.side_effect = get
+            data = await fetch_workspace_data()
+
+        assert data["projects"] == [] and data["users"] == {}
+
+    @pytest.mark.asyncio
+    async def test_fetch_workspace_data_primes_board_cache(self, mock_planka_api_client):
+        """Test that boards fetched for the workspace are kept in the board cache."""
+        board_detail = {"item": {"id": "board1", "name": "One"}, "included": {"cards": []}}
+        responses = {
+            "projects": {"items": [{"id": "proj1"}], "included": {"boards": [{"id": "board1", "projectId": "proj1"}]}},
+            "users": {"items": []},
+            "boards/board1": board_detail,
+        }
+
+        async def get(endpoint, params=None):
+            return responses[endpoint]
+
+        cache = PlankaCache()
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client), \
+             patch("planka_mcp.instances.cache", cache):
+            mock_planka_api_client.get.side_effect = get
+            await fetch_workspace_data()
+
+            fetch_func = AsyncMock()
+            assert await cache.get_board_overview("board1", fetch_func) is board_detail
+            fetch_func.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fetch_workspace_data_uses_boards_from_project_list(self, mock_planka_api_client):
+        """Test that boards included in the project list are used without per-project requests."""
+        responses = {
+            "projects": {
+                "items": [{"id": "proj1", "name": "Alpha"}, {"id": "proj2", "name": "Beta"}],
+                "included": {"boards": [
+                    {"id": "board3", "projectId": "proj2"},
+                    {"id": "board1", "projectId": "proj1"},
+                ]},
+            },
+            "users": {"items": []},
+            "boards/board1": {"item": {"id": "board1", "name": "One"}, "included": {}},
+            "boards/board3": {"item": {"id": "board3", "name": "Three"}, "included": {}},
+        }
+
+        async def get(endpoint, params=None):
+            return responses[endpoint]
+
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client):
+            mock_planka_api_client.get.side_effect = get
+
+            data = await fetch_workspace_data()
+
+        assert list(data["boards"]) == ["board1", "board3"]
+        assert data["boards"]["board3"]["project_name"] == "Beta"
+        assert mock_planka_api_client.get.call_count == len(responses)
+
+    @pytest.mark.asyncio
+    async def test_fetch_workspace_data_cancels_boards_after_failure(self, mock_planka_api_client):
+        """Test that a failing board request cancels the board requests still in flight."""
+        cancelled = asyncio.Event()
+        responses = {
+            "projects": {"items": [{"id": "proj1"}], "included": {"boards": [
+                {"id": "slow", "projectId": "proj1"},
+                {"id": "broken", "projectId": "proj1"},
+            ]}},
+            "users": {"items": []},
+        }
+
+        async def get(endpoint, params=None):
+            if endpoint == "boards/slow":
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            if endpoint == "boards/broken":
+                raise httpx.HTTPStatusError("API Error", request=Mock(), response=Mock(status_code=500))
+            return responses[endpoint]
+
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client):
+            mock_planka_api_client.get.side_effect = get
+
+            with pytest.raises(httpx.HTTPStatusError):
+                await fetch_workspace_data()
+
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_fetch_workspace_data_sorts_maps_for_display(self, mock_planka_api_client):
+        """Test that boards and users come back sorted, lists and labels in Planka's order."""
+        responses = {
+            "projects": {"items": [{"id": "proj1", "name": "Beta"}, {"id": "proj2", "name": "Alpha"}],
+                         "included": {"boards": [
+                             {"id": "board1", "projectId": "proj1"},
+                             {"id": "board2", "projectId": "proj2"},
+                         ]}},
+            "users": {"items": [{"id": "user1", "name": "Zoe"}, {"id": "user2", "name": "Adam"}]},
+            "boards/board1": {"item": {"id": "board1", "name": "Roadmap"}, "included": {
+                "lists": [
+                    {"id": "list2", "name": "Done", "position": 2},
+                    {"id": "list1", "name": "Todo", "position": 1},
+                ],
+                "labels": [{"id": "label1", "name": "Urgent"}, {"id": "label2", "name": "Bug"}],
+            }},
+            "boards/board2": {"item": {"id": "board2", "name": "Ops"}, "included": {}},
+        }
+
+        async def get(endpoint, params=None):
+            return responses[endpoint]
+
+        with patch("planka_mcp.instances.api_client", mock_planka_api_client):
+            mock_planka_api_client.get.side_effect = get
+
+            data = await fetch_workspace_data()
+
+        assert list(data["boards"]) == ["board2", "board1"]
+        assert list(data["lists"]) == ["list2", "list1"]
+        assert list(data["labels"]) == ["label1", "label2"]
+        assert list(data["users"]) == ["user2", "user1"]
+
     @pytest.mark.asyncio
     async def test_fetch_workspace_data_api_error(self, mock_planka_api_client):
         """Test that API errors are propagated."""
@@ -128,3 +295,38 @@ class TestFetchWorkspaceData:
             with pytest.raises(RuntimeError) as exc_info:
                 await fetch_workspace_data()
             assert "API client not initialized" in str(exc_info.value)
+
+
+class TestKeepWorkspaceWarm:
+    """Test the background workspace refresher."""
+
+    @pytest.mark.asyncio
+    async def test_refreshes_and_survives_errors(self, capsys):
+        """Test that a failed refresh is reported and the loop keeps going."""
+        cache = Mock()
+        cache.refresh_workspace = AsyncMock(side_effect=[RuntimeError("down"), {}, asyncio.CancelledError()])
+
+        with patch("planka_mcp.instances.cache", cache), \
+             patch("planka_mcp.handlers.workspace.asyncio.sleep", AsyncMock()) as mock_sleep:
+            with pytest.raises(asyncio.CancelledError):
+                await keep_workspace_warm(interval=5)
+
+        assert cache.refresh_workspace.call_count == 3
+        cache.refresh_workspace.assert_called_with(fetch_workspace_data)
+        mock_sleep.assert_called_with(5)
+        assert "Workspace cache refresh failed: down" in capsys.readouterr().err
+
+    @pytest.mark.asyncio
+    async def test_warm_workspace_soon_fetches_in_background(self, capsys):
+        """Test that the workspace fetch runs as a task and its failure is reported."""
+        cache = Mock()
+        cache.get_workspace = AsyncMock(side_effect=RuntimeError("down"))
+
+        with patch("planka_mcp.instances.cache", cache):
+            warm_workspace_soon()
+            cache.get_workspace.assert_not_awaited()
+            for _ in range(3):
+                await asyncio.sleep(0)
+
+        cache.get_workspace.assert_awaited_once_with(fetch_workspace_data)
+        assert "Workspace cache refresh failed: down" in capsys.readouterr().err